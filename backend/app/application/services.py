@@ -1,9 +1,13 @@
-from typing import List, Dict, Optional
-from ..domain.models import Recommendation, ZombieResource
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Dict, Optional, Tuple
+from ..domain.models import Recommendation, ScanIssue, ZombieResource
+from ..interfaces.cache import ResultCache
+from .versioning import content_version, report_delta
 from ..infrastructure.gcp.recommender_repository import GCPRecommendationRepository
 from ..infrastructure.gcp.monitoring_repository import GCPZombieRepository
 from ..infrastructure.gcp.resource_manager_repository import GCPProjectRepository
 from ..infrastructure.gcp.asset_repository import GCPAssetRepository
+from ..infrastructure.gcp.resilience import ApiDeadlineExceeded, describe_failure
 
 class FinOpsService:
     def __init__(
@@ -11,12 +15,76 @@ class FinOpsService:
         recommender_repo: GCPRecommendationRepository, 
         zombie_repo: GCPZombieRepository,
         project_repo: Optional[GCPProjectRepository] = None,
-        asset_repo: Optional[GCPAssetRepository] = None
+        asset_repo: Optional[GCPAssetRepository] = None,
+        cache: Optional[ResultCache] = None,
+        cache_ttl_seconds: int = 300,
+        history_ttl_seconds: int = 3600,
+        report_deadline_seconds: float = 30.0,
+        incomplete_ttl_seconds: int = 30,
+        zone_discovery_ttl_seconds: int = 3600
     ):
         self.recommender_repo = recommender_repo
         self.zombie_repo = zombie_repo
         self.project_repo = project_repo or GCPProjectRepository()
         self.asset_repo = asset_repo or GCPAssetRepository()
+        self.cache = cache
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # How long past report versions are kept so clients can ask for a delta since them
+        self.history_ttl_seconds = history_ttl_seconds
+        # Upper bound on report latency; late sources are dropped and the report marked incomplete
+        self.report_deadline_seconds = report_deadline_seconds
+        # Incomplete reports are cached only briefly so a recovered backend is picked up soon
+        self.incomplete_ttl_seconds = incomplete_ttl_seconds
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="report")
+        # Zones holding compute resources rarely change, so discovery is cached for longer
+        self.zone_discovery_ttl_seconds = zone_discovery_ttl_seconds
+
+    def _cached(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        refresh: bool = False,
+        keep_history: bool = False
+    ) -> Tuple[str, Any]:
+        """
+        Returns a shared cached (version, result) pair, computing it under a lock on the key
+        on a miss so that only one worker runs a given scan at a time. Different scans of
+        the same project (e.g. resources and a report) don't wait for each other.
+        The version is a content hash, so an unchanged rescan keeps the same version.
+        """
+        if self.cache is None:
+            result = compute()
+            return content_version(result), result
+
+        if not refresh:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+
+        with self.cache.lock(f"scan:{key}"):
+            # Another worker may have finished the same scan while we were waiting
+            if not refresh:
+                hit = self.cache.get(key)
+                if hit is not None:
+                    return hit
+            result = compute()
+            version = content_version(result)
+            complete = not isinstance(result, dict) or result.get("complete", True)
+            ttl = self.cache_ttl_seconds if complete else min(self.cache_ttl_seconds, self.incomplete_ttl_seconds)
+            self.cache.set(key, (version, result), ttl)
+            if keep_history:
+                self.cache.set(f"version:{version}", result, self.history_ttl_seconds)
+            return version, result
+
+    def get_backend_status(self) -> Dict[str, dict]:
+        """
+        Returns the initialization state of every GCP client used by the repositories.
+        Clients are built lazily, so 'uninitialized' is normal until the first request.
+        """
+        status = {}
+        for repo in (self.recommender_repo, self.zombie_repo, self.project_repo, self.asset_repo):
+            status.update(repo.backend_status())
+        return status
 
     def get_accessible_projects(self) -> List[Dict]:
         """
@@ -24,34 +92,172 @@ class FinOpsService:
         """
         return self.project_repo.list_accessible_projects()
 
-    def get_all_resources(self, project_id: str, zones: List[str] = None) -> List[Dict]:
+    def discover_zones(self, project_id: str, refresh: bool = False) -> List[str]:
+        """
+        Returns the zones that actually hold compute resources, plus the zones where only
+        zombies may be left (e.g. snapshots of deleted disks), so scans can skip empty zones.
+        Discovery is bounded by the report deadline and shared through the cache; an empty
+        result is kept only briefly, so newly created resources are picked up soon.
+        """
+        key = f"zones:{project_id}"
+        if self.cache is not None and not refresh:
+            zones = self.cache.get(key)
+            if zones is not None:
+                return zones
+
+        lookups = [
+            self._executor.submit(self.asset_repo.list_active_zones, project_id),
+            self._executor.submit(self.zombie_repo.list_zombie_zones, project_id, refresh),
+        ]
+        _, not_done = wait(lookups, timeout=self.report_deadline_seconds)
+        if not_done:
+            for future in not_done:
+                future.cancel()
+            raise ApiDeadlineExceeded(f"zone discovery exceeded {self.report_deadline_seconds:.0f}s deadline")
+        # A failed lookup raises rather than silently leaving zones out
+        zones = sorted({zone for future in lookups for zone in future.result()})
+        if self.cache is not None:
+            ttl = self.zone_discovery_ttl_seconds if zones else min(self.zone_discovery_ttl_seconds, self.incomplete_ttl_seconds)
+            self.cache.set(key, zones, ttl)
+        return zones
+
+    def get_all_resources(self, project_id: str, zones: List[str] = None, refresh: bool = False) -> List[Dict]:
         """
         Returns a list of all resources in the project, optionally filtered by zone.
         """
-        return self.asset_repo.list_all_resources(project_id, zones)
+        return self.get_versioned_resources(project_id, zones, refresh)[1]
 
-    def get_optimization_report(self, project_id: str, zones: List[str]) -> Dict:
+    def get_versioned_resources(
+        self, project_id: str, zones: List[str] = None, refresh: bool = False
+    ) -> Tuple[str, List[Dict]]:
+        """
+        Returns (version, resources), where version is a content hash of the inventory.
+        """
+        key = f"resources:{project_id}:{','.join(sorted(zones)) if zones else '*'}"
+        return self._cached(
+            key, lambda: self.asset_repo.list_all_resources(project_id, zones), refresh
+        )
+
+    def get_optimization_report(self, project_id: str, zones: List[str], refresh: bool = False) -> Dict:
         """
         Aggregates all FinOps insights for a project across multiple zones.
         """
+        return self.get_versioned_report(project_id, zones, refresh)[1]
+
+    def get_versioned_report(self, project_id: str, zones: List[str], refresh: bool = False) -> Tuple[str, Dict]:
+        """
+        Returns (version, report), where version is a content hash of the report.
+        """
+        # The report (zone order, regional attribution) must not depend on the caller's zone order
+        zones = sorted(set(zones))
+        if not zones:
+            # Nothing to scan (e.g. zones=auto on a project without compute resources)
+            report = self._empty_report(project_id)
+            return content_version(report), report
+
+        key = f"report:{project_id}:{','.join(zones)}"
+        return self._cached(
+            key, lambda: self._build_optimization_report(project_id, zones, refresh), refresh,
+            keep_history=True
+        )
+
+    def get_report_delta(
+        self, project_id: str, zones: List[str], since: str, refresh: bool = False
+    ) -> Tuple[str, Dict]:
+        """
+        Returns (version, delta) with the recommendations and zombies added, removed or changed
+        since an earlier report version. If that version is no longer known (or belongs to
+        another scan), the full report is returned with "delta": false.
+        """
+        version, report = self.get_versioned_report(project_id, zones, refresh)
+        previous = self.cache.get(f"version:{since}") if self.cache is not None and since != version else None
+
+        if since == version:
+            delta = report_delta(report, report)
+        elif (
+            previous is not None
+            and previous["project_id"] == project_id
+            and previous["zones_scanned"] == sorted(set(zones))
+        ):
+            delta = report_delta(previous, report)
+        else:
+            return version, {"version": version, "since": since, "delta": False, "report": report}
+
+        return version, {"version": version, "since": since, "delta": True, **delta}
+
+    def _empty_report(self, project_id: str) -> Dict:
+        return {
+            "project_id": project_id,
+            "zones_scanned": [],
+            "complete": True,
+            "issues": [],
+            "summary": {
+                "total_potential_savings": 0.0,
+                "currency": "USD",
+                "recommendation_count": 0,
+                "zombie_resource_count": 0,
+                "cost_by_zone": {}
+            },
+            "recommendations": [],
+            "zombie_resources": []
+        }
+
+    def _build_optimization_report(self, project_id: str, zones: List[str], refresh: bool = False) -> Dict:
         all_recommendations = []
         all_zombies = []
+        issues: List[ScanIssue] = []
         
         cost_by_zone = {} # { "us-central1-a": 120.50 }
 
+        # Every recommender/zone pair and the zombie scan run concurrently under one report
+        # deadline; whatever hasn't finished by then is left out and the report marked incomplete
+        tasks = {}
+        for zone in zones:
+            for rec_id in self.recommender_repo.recommender_ids:
+                future = self._executor.submit(self.recommender_repo.get_recommendations, project_id, zone, [rec_id])
+                tasks[future] = (f"recommender:{zone}/{rec_id}", zone)
+        # Zombie detection fetches the project inventory once for all zones
+        zombie_future = self._executor.submit(self.zombie_repo.detect_zombies_in_zones, project_id, zones, refresh)
+        tasks[zombie_future] = ("zombies", None)
+
+        _, not_done = wait(tasks, timeout=self.report_deadline_seconds)
+        for future in not_done:
+            # Queued tasks are dropped; running ones finish at their own API deadline
+            future.cancel()
+
+        # Results are assembled in submission order (zones x recommenders), not completion
+        # order, so identical scans produce identical reports and content versions
+        recs_by_zone = {zone: [] for zone in zones}
+        zombies_by_zone = {}
+        for future, (source, zone) in tasks.items():
+            if future in not_done:
+                issues.append(ScanIssue(source=source, reason="report deadline exceeded"))
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                issues.append(ScanIssue(source=source, reason=describe_failure(e)))
+                continue
+
+            if future is zombie_future:
+                zombies_by_zone, zombie_issues = result
+                issues.extend(zombie_issues)
+            else:
+                recs_by_zone[zone].extend(result)
+
         for zone in zones:
             zone_savings = 0.0
             
-            # 1. Fetch Recommendations
-            recs = self.recommender_repo.get_recommendations(project_id, zone)
+            # 1. Recommendations
+            recs = recs_by_zone[zone]
             all_recommendations.extend(recs)
             
             for rec in recs:
                  if rec.cost_savings:
                     zone_savings += abs(rec.cost_savings.amount_per_month)
 
-            # 2. Detect Zombies
-            zombies = self.zombie_repo.detect_zombies(project_id, zone)
+            # 2. Zombies
+            zombies = zombies_by_zone.get(zone, [])
             all_zombies.extend(zombies)
             
             for zombie in zombies:
@@ -68,6 +274,8 @@ class FinOpsService:
         return {
             "project_id": project_id,
             "zones_scanned": zones,
+            "complete": not issues,
+            "issues": sorted(issues, key=lambda issue: issue.source),
             "summary": {
                 "total_potential_savings": total_savings,
                 "currency": currency,
@@ -0,0 +1,42 @@
+import dataclasses
+import hashlib
+import json
+from typing import Any, Callable, Dict, List
+
+def _to_plain(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
+
+def content_version(payload: Any) -> str:
+    """
+    Stable content hash of a report or inventory. Equal content always gives the same
+    version, independent of dict ordering or which worker produced it.
+    """
+    canonical = json.dumps(payload, default=_to_plain, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+def _diff(old: List[Any], new: List[Any], key: Callable[[Any], Any]) -> Dict[str, List]:
+    old_by_key = {key(item): item for item in old}
+    new_by_key = {key(item): item for item in new}
+    return {
+        "added": [item for k, item in new_by_key.items() if k not in old_by_key],
+        "removed": [k for k in old_by_key if k not in new_by_key],
+        "changed": [item for k, item in new_by_key.items() if k in old_by_key and old_by_key[k] != item],
+    }
+
+def _zombie_key(zombie) -> str:
+    return f"{zombie.resource_type}/{zombie.resource_id}"
+
+def report_delta(old: Dict, new: Dict) -> Dict:
+    """
+    Added, removed and changed recommendations and zombies between two reports.
+    Removed entries are listed by key: recommendation_id, or "resource_type/resource_id" for zombies.
+    """
+    return {
+        "complete": new["complete"],
+        "issues": new["issues"],
+        "summary": new["summary"],
+        "recommendations": _diff(old["recommendations"], new["recommendations"], lambda r: r.recommendation_id),
+        "zombie_resources": _diff(old["zombie_resources"], new["zombie_resources"], _zombie_key),
+    }
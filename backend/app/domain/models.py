@@ -40,3 +40,8 @@ class Resource:
 class ZombieResource(Resource):
     waste_reason: str = "Unknown" # 'Idle VM', 'Unattached Disk', 'Unused IP'
     estimated_monthly_waste: Optional[float] = 0.0
+
+@dataclass
+class ScanIssue:
+    source: str # 'recommender:us-central1-a/google.compute.instance.IdleResourceRecommender', 'inventory:disks'
+    reason: str # 'deadline exceeded', 'circuit open', or the API error
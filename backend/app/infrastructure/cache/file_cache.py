@@ -0,0 +1,153 @@
+import fcntl
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import IO, Any, Optional
+from ...interfaces.cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+class FileResultCache(ResultCache):
+    """
+    Result cache stored as pickle files in a local directory.
+    All uvicorn workers in the same container share the directory, and locks use flock.
+    Each entry's mtime is set to its expiry time, so `set` can sweep expired entries
+    (at most every `sweep_interval_seconds`) without unpickling them; idle lock files
+    are swept too.
+    """
+    def __init__(self, directory: str, lock_wait_seconds: float = 300.0, sweep_interval_seconds: float = 300.0):
+        self.directory = directory
+        self.lock_wait_seconds = lock_wait_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._next_sweep = 0.0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str, suffix: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + suffix)
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key, ".pkl")
+        try:
+            with open(path, "rb") as f:
+                expires_at, value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry for {key}: {e}")
+            return None
+
+        if expires_at < time.time():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        expires_at = time.time() + ttl_seconds
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((expires_at, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.utime(tmp_path, (expires_at, expires_at))
+            os.replace(tmp_path, self._path(key, ".pkl"))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+        if time.monotonic() >= self._next_sweep:
+            self._next_sweep = time.monotonic() + self.sweep_interval_seconds
+            self.sweep()
+
+    def sweep(self) -> int:
+        """
+        Removes expired entries, temp files left behind by a crashed writer, and lock
+        files that haven't been used for `sweep_interval_seconds`.
+        Returns the number of files removed.
+        """
+        now = time.time()
+        removed = 0
+        for entry in os.scandir(self.directory):
+            try:
+                if entry.name.endswith(".pkl"):
+                    expired = entry.stat().st_mtime < now
+                elif entry.name.endswith(".tmp"):
+                    expired = entry.stat().st_mtime < now - self.sweep_interval_seconds
+                elif entry.name.endswith(".lock"):
+                    if entry.stat().st_mtime < now - self.sweep_interval_seconds:
+                        removed += self._remove_idle_lock(entry.path)
+                    continue
+                else:
+                    continue
+                if expired:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError:
+                # Already removed or replaced by another worker
+                pass
+        return removed
+
+    def _remove_idle_lock(self, path: str) -> int:
+        # Removed only while we hold it, so no one is inside the lock; _acquire notices
+        # that a file it was waiting on was removed and locks the new one instead
+        fd = os.open(path, os.O_WRONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return 0
+        try:
+            if os.stat(path).st_ino != os.fstat(fd).st_ino:
+                return 0
+            os.remove(path)
+            return 1
+        finally:
+            os.close(fd)
+
+    def _acquire(self, name: str) -> Optional[IO]:
+        """
+        Returns the lock file, locked, or None if waiting timed out.
+        """
+        path = self._path(name, ".lock")
+        deadline = time.monotonic() + self.lock_wait_seconds
+        f = open(path, "a")
+        while True:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    logger.warning(f"Timed out waiting for lock {name}; continuing without it")
+                    f.close()
+                    return None
+                time.sleep(0.1)
+                continue
+
+            # sweep() may have removed the file since we opened it, and a lock on a
+            # removed file excludes no one, so lock the current file instead
+            try:
+                current = os.stat(path).st_ino == os.fstat(f.fileno()).st_ino
+            except FileNotFoundError:
+                current = False
+            if current:
+                # Marks the lock as recently used, so sweep() leaves it alone
+                os.utime(path)
+                return f
+            f.close()
+            f = open(path, "a")
+
+    @contextmanager
+    def lock(self, name: str):
+        f = self._acquire(name)
+        try:
+            yield f is not None
+        finally:
+            if f is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+                f.close()
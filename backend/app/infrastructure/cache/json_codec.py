@@ -0,0 +1,40 @@
+import dataclasses
+import json
+from datetime import datetime
+from typing import Any, Dict
+from ...domain import models
+
+# Only these types are rebuilt on load, so a cached value can't name arbitrary code
+_DATACLASSES: Dict[str, type] = {
+    cls.__name__: cls
+    for cls in (
+        models.CostSavings, models.Operation, models.Recommendation,
+        models.Resource, models.ZombieResource, models.ScanIssue
+    )
+}
+
+def _encode(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and type(value).__name__ in _DATACLASSES:
+        fields = {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+        return {"__dataclass__": type(value).__name__, **fields}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+def _decode(obj: Dict) -> Any:
+    if "__dataclass__" in obj:
+        cls = _DATACLASSES[obj.pop("__dataclass__")]
+        return cls(**obj)
+    if "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+def dumps(value: Any) -> bytes:
+    """
+    Serializes a cached value (plain JSON types, domain dataclasses and datetimes) to JSON.
+    Tuples come back as lists.
+    """
+    return json.dumps(value, default=_encode, separators=(",", ":")).encode("utf-8")
+
+def loads(data: bytes) -> Any:
+    return json.loads(data, object_hook=_decode)
@@ -0,0 +1,82 @@
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Optional
+from ...interfaces.cache import ResultCache
+from . import json_codec
+
+logger = logging.getLogger(__name__)
+
+# Deletes the lock only if it still holds our token, in one atomic step
+_RELEASE_LOCK = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+class RedisResultCache(ResultCache):
+    """
+    Result cache backed by any Redis-compatible server.
+    Pass `client` to use an existing connection (or a local stand-in such as fakeredis);
+    otherwise the optional `redis` package is imported and connected to `url`.
+    Only GET, SET (with EX/NX/PX) and EVAL (to release locks) are used, so a stand-in
+    must support Lua scripting, e.g. `pip install fakeredis[lua]`.
+    Values are stored as JSON (see json_codec) rather than pickled, so whoever can write
+    to the server can't run code in the workers.
+    """
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Optional[Any] = None,
+        prefix: str = "finops:",
+        lock_lease_seconds: int = 600,
+        lock_wait_seconds: float = 300.0
+    ):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self.client = client
+        self.prefix = prefix
+        self.lock_lease_seconds = lock_lease_seconds
+        self.lock_wait_seconds = lock_wait_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        try:
+            return json_codec.loads(raw)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry for {key}: {e}")
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        self.client.set(
+            self.prefix + key,
+            json_codec.dumps(value),
+            ex=ttl_seconds
+        )
+
+    @contextmanager
+    def lock(self, name: str):
+        lock_key = f"{self.prefix}lock:{name}"
+        token = uuid.uuid4().hex.encode("utf-8")
+        acquired = False
+        deadline = time.monotonic() + self.lock_wait_seconds
+        # The lease expires on its own, so a crashed worker can't hold the lock forever
+        while True:
+            if self.client.set(lock_key, token, nx=True, px=self.lock_lease_seconds * 1000):
+                acquired = True
+                break
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for lock {name}; continuing without it")
+                break
+            time.sleep(0.1)
+        try:
+            yield acquired
+        finally:
+            # Only release our own lease; it may have expired and been taken by another worker
+            if acquired:
+                self.client.eval(_RELEASE_LOCK, 1, lock_key, token)
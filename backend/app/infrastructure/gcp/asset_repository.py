@@ -1,21 +1,51 @@
-from google.cloud import asset_v1
 from typing import List, Dict
+from .lazy_client import LazyClient
+from .proto import raw_pages, to_datetime
+from .resilience import call_api
+
+def _build_asset_client():
+    from google.cloud import asset_v1
+    return asset_v1.AssetServiceClient()
+
+def map_resource(resource) -> Dict:
+    """
+    Maps a raw ResourceSearchResult protobuf to the inventory record.
+    """
+    create_time = to_datetime(resource, "create_time")
+    return {
+        "name": resource.display_name,
+        "asset_type": resource.asset_type,
+        "location": resource.location,
+        "project": resource.project.split('/')[-1], # projects/xyz -> xyz
+        "state": resource.state,
+        "create_time": create_time.strftime("%Y-%m-%d %H:%M:%S") if create_time else "N/A"
+    }
+
+def _is_zone(location: str) -> bool:
+    # Zones look like "us-central1-a"; regions ("us-central1") and multi-regions ("US") don't
+    parts = location.split("-")
+    return len(parts) == 3 and len(parts[2]) == 1
 
 class GCPAssetRepository:
     def __init__(self):
-        try:
-            self.client = asset_v1.AssetServiceClient()
-        except Exception as e:
-            print(f"Warning: Could not initialize AssetServiceClient. Error: {e}")
-            self.client = None
+        # The SDK import and client construction are deferred until the first query
+        self._client = LazyClient("AssetServiceClient", _build_asset_client)
+
+    @property
+    def client(self):
+        return self._client.get()
+
+    def backend_status(self) -> Dict[str, dict]:
+        return {"asset": self._client.status()}
 
     def list_all_resources(self, project_id: str, zones: List[str] = None) -> List[Dict]:
         """
         Search for all resources in the project using Cloud Asset Inventory.
         Optionally filters by zone if the resource location matches.
         """
-        if not self.client:
-            return []
+        client = self._client.require()
+
+        from google.cloud import asset_v1
 
         try:
             scope = f"projects/{project_id}"
@@ -41,34 +71,47 @@ class GCPAssetRepository:
                 page_size=100
             )
 
-            results = []
-            for resource in self.client.search_all_resources(request=request):
-                # Basic zone filtering
-                # location usually looks like "us-central1-a" or "us-central1"
-                location = resource.location
-                
-                if zones:
-                    # If specific zones are requested, filter. 
-                    # Note: Global resources like buckets often have location "US" or "Multi-region".
-                    # We should probably include them if they match or if it's broad.
-                    # For strict zone filtering (e.g. only us-central1-a resources):
-                    if location not in zones and location not in [z[:-2] for z in zones]: # Try to match region too
-                        # If it's a global resource, maybe keep it? Let's just filter strictly for now if zones are provided,
-                        # but keep global if not specific.
-                        # Actually, easy logic: if resource is zonal and not in zones, skip.
-                        pass
-                
-                results.append({
-                    "name": resource.display_name,
-                    "asset_type": resource.asset_type,
-                    "location": resource.location,
-                    "project": resource.project.split('/')[-1], # projects/xyz -> xyz
-                    "state": resource.state,
-                    "create_time": resource.create_time.strftime("%Y-%m-%d %H:%M:%S") if resource.create_time else "N/A"
-                })
-            
-            return results
+            # Zone filtering is not applied: global resources such as buckets report
+            # locations like "US", and the inventory view keeps them alongside zonal ones.
+            def search(timeout: float) -> List[Dict]:
+                results = []
+                for page in raw_pages(client.search_all_resources(request=request, timeout=timeout)):
+                    results.extend(map_resource(resource) for resource in page.results)
+                return results
+
+            return call_api("asset", search)
 
         except Exception as e:
+            # Surface the failure instead of an empty inventory that looks like a real result
             print(f"Error searching assets: {e}")
-            return []
+            raise
+
+    def list_active_zones(self, project_id: str) -> List[str]:
+        """
+        Returns the zones that hold compute instances or disks, using a single
+        Asset Inventory search that reads only each resource's location.
+        Regional-only resources (e.g. a static IP in a region with no VMs or disks)
+        don't surface a zone and are not covered.
+        """
+        client = self._client.require()
+
+        from google.cloud import asset_v1
+        from google.protobuf import field_mask_pb2
+
+        request = asset_v1.SearchAllResourcesRequest(
+            scope=f"projects/{project_id}",
+            asset_types=[
+                "compute.googleapis.com/Instance",
+                "compute.googleapis.com/Disk"
+            ],
+            read_mask=field_mask_pb2.FieldMask(paths=["location"]),
+            page_size=500
+        )
+
+        def search(timeout: float) -> List[str]:
+            locations = set()
+            for page in raw_pages(client.search_all_resources(request=request, timeout=timeout)):
+                locations.update(resource.location for resource in page.results)
+            return sorted(loc for loc in locations if _is_zone(loc))
+
+        return call_api("asset", search)
@@ -0,0 +1,161 @@
+from typing import Dict, List, Optional
+from ...domain.models import ZombieResource
+from ...interfaces.detectors import Inventory, ZombieDetector
+
+# Simplified pricing table (monthly in USD)
+# In a real app, use the Cloud Billing Catalog API
+PRICING = {
+    "e2-micro": 6.11,
+    "e2-small": 12.23,
+    "e2-medium": 24.46,
+    "e2-standard-2": 48.92,
+    "n1-standard-1": 24.27,
+    "n2-standard-2": 48.54,
+    "c2-standard-4": 126.63
+}
+
+DISK_PRICE_PER_GB = 0.04 # Rough estimate $0.04/GB
+SNAPSHOT_PRICE_PER_GB = 0.026
+STATIC_IP_PRICE = 2.50 # roughly $2.50/mo
+
+def snapshot_zone(snap: Dict) -> Optional[str]:
+    """The zone of a snapshot's source disk, or None for regional or unknown disks."""
+    # projects/p/zones/us-central1-a/disks/name -> us-central1-a
+    parts = snap["source_disk"].split("/")
+    return parts[parts.index("zones") + 1] if "zones" in parts else None
+
+class IdleVmDetector(ZombieDetector):
+    name = "idle_vms"
+    requires = ("cpu_utilization", "instances")
+
+    def __init__(self, threshold: float = 0.05):
+        self.threshold = threshold
+
+    def detect(self, inventory: Inventory) -> List[ZombieResource]:
+        instances = {inst["id"]: inst for inst in inventory.get("instances")}
+        idle = []
+        for instance_id, usage in inventory.get("cpu_utilization").items():
+            if usage["zone"] not in inventory.zones or usage["peak"] > self.threshold:
+                continue
+
+            # Deleted instances still have metric history, and stopped ones are reported by StoppedVmDetector
+            inst = instances.get(instance_id)
+            if inst is None or inst["status"] != "RUNNING":
+                continue
+            idle.append(ZombieResource(
+                resource_id=instance_id,
+                resource_type="gce_instance",
+                name=inst["name"],
+                project_id=inventory.project_id,
+                zone=usage["zone"],
+                waste_reason=f"Idle VM (< {self.threshold:.0%} CPU)",
+                # Default to $20 if the machine type is unknown
+                estimated_monthly_waste=PRICING.get(inst["machine_type"], 20.0)
+            ))
+        return idle
+
+class UnattachedDiskDetector(ZombieDetector):
+    name = "unattached_disks"
+    requires = ("disks",)
+
+    def detect(self, inventory: Inventory) -> List[ZombieResource]:
+        return [
+            ZombieResource(
+                resource_id=disk["id"],
+                resource_type="disk",
+                name=disk["name"],
+                project_id=inventory.project_id,
+                zone=disk["zone"],
+                waste_reason="Unattached Disk",
+                metadata={"size_gb": disk["size_gb"]},
+                estimated_monthly_waste=disk["size_gb"] * DISK_PRICE_PER_GB
+            )
+            for disk in inventory.get("disks")
+            if disk["zone"] in inventory.zones and not disk["users"]
+        ]
+
+class UnusedIpDetector(ZombieDetector):
+    name = "unused_ips"
+    requires = ("addresses",)
+
+    def detect(self, inventory: Inventory) -> List[ZombieResource]:
+        return [
+            ZombieResource(
+                resource_id=addr["id"],
+                resource_type="ip_address",
+                name=addr["name"],
+                project_id=inventory.project_id,
+                region=addr["region"],
+                waste_reason="Unused Static IP",
+                estimated_monthly_waste=STATIC_IP_PRICE
+            )
+            for addr in inventory.get("addresses")
+            if addr["region"] in inventory.regions and addr["status"] == "RESERVED" and not addr["users"]
+        ]
+
+class OrphanedSnapshotDetector(ZombieDetector):
+    """
+    Snapshots whose source disk has been deleted. Attributed to the source disk's zone.
+    """
+    name = "orphaned_snapshots"
+    requires = ("snapshots", "disks")
+
+    def detect(self, inventory: Inventory) -> List[ZombieResource]:
+        disk_ids = {disk["id"] for disk in inventory.get("disks")}
+        orphans = []
+        for snap in inventory.get("snapshots"):
+            zone = snapshot_zone(snap)
+            if zone not in inventory.zones or snap["source_disk_id"] in disk_ids:
+                continue
+
+            size_gb = snap["storage_bytes"] / 1e9
+            orphans.append(ZombieResource(
+                resource_id=snap["id"],
+                resource_type="snapshot",
+                name=snap["name"],
+                project_id=inventory.project_id,
+                zone=zone,
+                waste_reason="Orphaned Snapshot",
+                metadata={"storage_gb": round(size_gb, 2)},
+                estimated_monthly_waste=size_gb * SNAPSHOT_PRICE_PER_GB
+            ))
+        return orphans
+
+class StoppedVmDetector(ZombieDetector):
+    """
+    Stopped (TERMINATED) VMs still pay for their attached persistent disks.
+    """
+    name = "stopped_vms"
+    requires = ("instances", "disks")
+
+    def detect(self, inventory: Inventory) -> List[ZombieResource]:
+        disk_sizes = {disk["self_link"]: disk["size_gb"] for disk in inventory.get("disks")}
+        stopped = []
+        for inst in inventory.get("instances"):
+            if inst["zone"] not in inventory.zones or inst["status"] != "TERMINATED":
+                continue
+
+            size_gb = sum(disk_sizes.get(source, 0) for source in inst["disks"])
+            if not size_gb:
+                continue
+            stopped.append(ZombieResource(
+                resource_id=inst["id"],
+                resource_type="gce_instance",
+                name=inst["name"],
+                project_id=inventory.project_id,
+                zone=inst["zone"],
+                status=inst["status"],
+                waste_reason="Stopped VM with billed disks",
+                metadata={"attached_disk_gb": size_gb},
+                estimated_monthly_waste=size_gb * DISK_PRICE_PER_GB
+            ))
+        return stopped
+
+def default_detectors() -> List[ZombieDetector]:
+    return [
+        IdleVmDetector(),
+        UnattachedDiskDetector(),
+        UnusedIpDetector(),
+        OrphanedSnapshotDetector(),
+        StoppedVmDetector(),
+    ]
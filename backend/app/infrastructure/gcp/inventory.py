@@ -0,0 +1,271 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import time
+import logging
+from ...interfaces.cache import ResultCache
+from concurrent.futures import ThreadPoolExecutor
+from ...domain.models import ScanIssue
+from ...interfaces.detectors import Inventory
+from .lazy_client import LazyClient
+from .proto import raw_pages
+from .resilience import call_api, describe_failure
+
+logger = logging.getLogger(__name__)
+
+# Fetches the datasets of one scan concurrently
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="inventory")
+
+def _build_metric_client():
+    from google.cloud import monitoring_v3
+    return monitoring_v3.MetricServiceClient()
+
+def _build_instances_client():
+    from google.cloud import compute_v1
+    return compute_v1.InstancesClient()
+
+def _build_disks_client():
+    from google.cloud import compute_v1
+    return compute_v1.DisksClient()
+
+def _build_addresses_client():
+    from google.cloud import compute_v1
+    return compute_v1.AddressesClient()
+
+def _build_snapshots_client():
+    from google.cloud import compute_v1
+    return compute_v1.SnapshotsClient()
+
+def _last_segment(url: str) -> str:
+    # zones/us-central1-a/machineTypes/e2-medium -> e2-medium
+    return url.split("/")[-1] if url else ""
+
+# The map_* functions take raw protobuf messages (see proto.raw_pages), not proto-plus wrappers
+
+def map_instance(inst) -> Dict:
+    return {
+        "id": str(inst.id),
+        "name": inst.name,
+        "zone": _last_segment(inst.zone),
+        "machine_type": _last_segment(inst.machine_type),
+        "status": inst.status,
+        "disks": [d.source for d in inst.disks],
+    }
+
+def map_disk(disk) -> Dict:
+    return {
+        "id": str(disk.id),
+        "name": disk.name,
+        "zone": _last_segment(disk.zone),
+        "size_gb": disk.size_gb,
+        "users": list(disk.users),
+        "self_link": disk.self_link,
+    }
+
+def map_address(addr) -> Dict:
+    return {
+        "id": str(addr.id),
+        "name": addr.name,
+        "region": _last_segment(addr.region),
+        "status": addr.status,
+        "users": list(addr.users),
+    }
+
+def map_snapshot(snap) -> Dict:
+    return {
+        "id": str(snap.id),
+        "name": snap.name,
+        "source_disk": snap.source_disk,
+        "source_disk_id": snap.source_disk_id,
+        "storage_bytes": snap.storage_bytes,
+    }
+
+def map_cpu_series(series) -> Tuple[str, Dict]:
+    """
+    Maps a CPU utilization series to (instance id, {zone, peak daily mean}).
+    """
+    labels = series.resource.labels
+    return labels.get("instance_id"), {
+        "zone": labels.get("zone"),
+        "peak": max((point.value.double_value for point in series.points), default=0.0),
+    }
+
+class GCPInventoryFetcher:
+    """
+    Fetches each project-wide dataset with a single API pass (Compute aggregated lists,
+    one Monitoring query) and maps it to plain records that detectors share.
+    Datasets are kept in the shared result cache, so all workers reuse the same copy.
+    """
+    def __init__(self, cache: Optional[ResultCache] = None, cache_ttl_seconds: int = 300):
+        self.cache = cache
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._metric_client = LazyClient("MetricServiceClient", _build_metric_client)
+        self._instances_client = LazyClient("InstancesClient", _build_instances_client)
+        self._disks_client = LazyClient("DisksClient", _build_disks_client)
+        self._addresses_client = LazyClient("AddressesClient", _build_addresses_client)
+        self._snapshots_client = LazyClient("SnapshotsClient", _build_snapshots_client)
+        self._fetchers: Dict[str, Callable[[str], Any]] = {
+            "instances": self._fetch_instances,
+            "disks": self._fetch_disks,
+            "addresses": self._fetch_addresses,
+            "snapshots": self._fetch_snapshots,
+            "cpu_utilization": self._fetch_cpu_utilization,
+        }
+
+    def backend_status(self) -> Dict[str, dict]:
+        return {
+            "monitoring": self._metric_client.status(),
+            "compute_instances": self._instances_client.status(),
+            "compute_disks": self._disks_client.status(),
+            "compute_addresses": self._addresses_client.status(),
+            "compute_snapshots": self._snapshots_client.status(),
+        }
+
+    @property
+    def datasets(self) -> List[str]:
+        return list(self._fetchers)
+
+    def fetch(
+        self, project_id: str, zones: List[str], required: Iterable[str], refresh: bool = False
+    ) -> Tuple[Inventory, List[ScanIssue]]:
+        """
+        Builds an inventory holding each required dataset, fetched once regardless of
+        how many detectors asked for it. Datasets are fetched concurrently; ones that
+        fail are left out of the inventory and reported as issues.
+        With refresh, cached datasets are ignored and replaced.
+        """
+        names = sorted(set(required))
+        for name in names:
+            if name not in self._fetchers:
+                raise ValueError(f"Unknown inventory dataset: {name}")
+
+        futures = {name: _executor.submit(self.get_dataset, project_id, name, refresh) for name in names}
+        datasets, issues = {}, []
+        for name, future in futures.items():
+            try:
+                datasets[name] = future.result()
+            except Exception as e:
+                logger.error(f"Error fetching {name} inventory: {e}")
+                issues.append(ScanIssue(source=f"inventory:{name}", reason=describe_failure(e)))
+        return Inventory(project_id, zones, datasets), issues
+
+    def get_dataset(self, project_id: str, name: str, refresh: bool = False) -> Any:
+        """
+        One dataset, from the shared cache unless refresh is set. Raises if the fetch fails.
+        """
+        key = f"inventory:{project_id}:{name}"
+        if self.cache is not None and not refresh:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        data = self._fetchers[name](project_id)
+        if self.cache is not None:
+            self.cache.set(key, data, self.cache_ttl_seconds)
+        return data
+
+    def _fetch_instances(self, project_id: str) -> List[Dict]:
+        client = self._instances_client.require()
+
+        from google.cloud import compute_v1
+
+        request = compute_v1.AggregatedListInstancesRequest(project=project_id)
+
+        def list_instances(timeout: float) -> List[Dict]:
+            instances = []
+            for page in raw_pages(client.aggregated_list(request=request, timeout=timeout)):
+                for scoped in page.items.values():
+                    instances.extend(map(map_instance, scoped.instances))
+            return instances
+
+        return call_api("compute", list_instances)
+
+    def _fetch_disks(self, project_id: str) -> List[Dict]:
+        client = self._disks_client.require()
+
+        from google.cloud import compute_v1
+
+        request = compute_v1.AggregatedListDisksRequest(project=project_id)
+
+        def list_disks(timeout: float) -> List[Dict]:
+            disks = []
+            for page in raw_pages(client.aggregated_list(request=request, timeout=timeout)):
+                for scoped in page.items.values():
+                    disks.extend(map(map_disk, scoped.disks))
+            return disks
+
+        return call_api("compute", list_disks)
+
+    def _fetch_addresses(self, project_id: str) -> List[Dict]:
+        client = self._addresses_client.require()
+
+        from google.cloud import compute_v1
+
+        request = compute_v1.AggregatedListAddressesRequest(project=project_id)
+
+        def list_addresses(timeout: float) -> List[Dict]:
+            addresses = []
+            for page in raw_pages(client.aggregated_list(request=request, timeout=timeout)):
+                for scoped in page.items.values():
+                    addresses.extend(map(map_address, scoped.addresses))
+            return addresses
+
+        return call_api("compute", list_addresses)
+
+    def _fetch_snapshots(self, project_id: str) -> List[Dict]:
+        client = self._snapshots_client.require()
+
+        from google.cloud import compute_v1
+
+        request = compute_v1.ListSnapshotsRequest(project=project_id)
+
+        def list_snapshots(timeout: float) -> List[Dict]:
+            snapshots = []
+            for page in raw_pages(client.list(request=request, timeout=timeout)):
+                snapshots.extend(map(map_snapshot, page.items))
+            return snapshots
+
+        return call_api("compute", list_snapshots)
+
+    def _fetch_cpu_utilization(self, project_id: str, days: int = 30) -> Dict[str, Dict]:
+        """
+        One Monitoring query for the whole project.
+        Returns instance id -> {zone, peak} where peak is the highest daily mean CPU utilization.
+        """
+        client = self._metric_client.require()
+
+        from google.cloud import monitoring_v3
+
+        now = time.time()
+        seconds = int(now)
+        nanos = int((now - seconds) * 10**9)
+
+        interval = monitoring_v3.TimeInterval(
+            {
+                "end_time": {"seconds": seconds, "nanos": nanos},
+                "start_time": {"seconds": seconds - (days * 86400), "nanos": nanos},
+            }
+        )
+
+        aggregation = monitoring_v3.Aggregation(
+            {
+                "alignment_period": {"seconds": 86400},
+                "per_series_aligner": monitoring_v3.Aggregation.Aligner.ALIGN_MEAN,
+                "cross_series_reducer": monitoring_v3.Aggregation.Reducer.REDUCE_MAX,
+                "group_by_fields": ["resource.label.instance_id", "resource.label.zone"],
+            }
+        )
+
+        request = {
+            "name": f"projects/{project_id}",
+            "filter": 'metric.type = "compute.googleapis.com/instance/cpu/utilization"',
+            "interval": interval,
+            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
+            "aggregation": aggregation,
+        }
+
+        def list_time_series(timeout: float) -> Dict[str, Dict]:
+            utilization = {}
+            for page in raw_pages(client.list_time_series(request=request, timeout=timeout)):
+                utilization.update(map(map_cpu_series, page.time_series))
+            return utilization
+
+        return call_api("monitoring", list_time_series)
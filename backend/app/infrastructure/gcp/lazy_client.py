@@ -0,0 +1,88 @@
+import threading
+import time
+import weakref
+import logging
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Every LazyClient, so failed ones can be retried from the readiness probe
+_clients: "weakref.WeakSet[LazyClient]" = weakref.WeakSet()
+
+class ClientUnavailableError(RuntimeError):
+    """The SDK client could not be constructed (e.g. missing credentials)."""
+
+class LazyClient:
+    """
+    Defers importing a google-cloud SDK and constructing its client until first use.
+    A failed construction is remembered so missing credentials don't retry on every
+    request, and is retried once `retry_backoff_seconds` have passed, so a transient
+    credentials or metadata-server error doesn't need a restart.
+    """
+    UNINITIALIZED = "uninitialized"
+    READY = "ready"
+    FAILED = "failed"
+
+    def __init__(self, name: str, factory: Callable[[], Any], retry_backoff_seconds: float = 30.0):
+        self.name = name
+        self._factory = factory
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._lock = threading.Lock()
+        self._client = None
+        self._state = self.UNINITIALIZED
+        self._error: Optional[str] = None
+        self._failed_at = 0.0
+        _clients.add(self)
+
+    def _should_build(self) -> bool:
+        if self._state == self.UNINITIALIZED:
+            return True
+        return self._state == self.FAILED and time.monotonic() - self._failed_at >= self.retry_backoff_seconds
+
+    def get(self) -> Optional[Any]:
+        """
+        Returns the client, building it on first call. Returns None if construction failed
+        and the retry backoff hasn't elapsed yet.
+        """
+        if self._should_build():
+            with self._lock:
+                if self._should_build():
+                    try:
+                        self._client = self._factory()
+                        self._state = self.READY
+                        self._error = None
+                    except Exception as e:
+                        logger.warning(f"Could not initialize {self.name}. Error: {e}")
+                        self._error = str(e)
+                        self._state = self.FAILED
+                        self._failed_at = time.monotonic()
+        return self._client
+
+    def require(self) -> Any:
+        """
+        Like get(), but raises ClientUnavailableError with the construction error instead of
+        returning None, so a missing client fails the call rather than looking like no data.
+        """
+        client = self.get()
+        if client is None:
+            raise ClientUnavailableError(f"{self.name} unavailable: {self._error}")
+        return client
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def status(self) -> dict:
+        status = {"state": self._state}
+        if self._error:
+            status["error"] = self._error
+        return status
+
+def retry_failed_clients() -> None:
+    """
+    Retries every failed client whose backoff has elapsed. Clients that were never used
+    stay uninitialized.
+    """
+    for client in list(_clients):
+        if client.state == LazyClient.FAILED:
+            client.get()
@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+
+# Mapping helpers that read the raw protobuf messages under proto-plus wrappers.
+# Every attribute access on a proto-plus message goes through the marshal layer and
+# allocates wrapper objects; reading the raw message avoids that on large pages.
+
+def raw(message: Any) -> Any:
+    """Returns the underlying protobuf message of a proto-plus message, without copying."""
+    return type(message).pb(message)
+
+def raw_pages(pager: Any) -> Iterator[Any]:
+    """Yields each page of a GAPIC pager as its raw protobuf response."""
+    for page in pager.pages:
+        yield raw(page)
+
+def to_datetime(message: Any, field: str) -> Optional[datetime]:
+    """Converts a Timestamp field to an aware UTC datetime, or None if it is unset."""
+    if not message.HasField(field):
+        return None
+    return getattr(message, field).ToDatetime(tzinfo=timezone.utc)
@@ -1,63 +1,95 @@
-from typing import List, Dict
-from google.cloud import recommender_v1
+from typing import List, Dict, Optional
 import logging
 from ...domain.models import Recommendation, Operation, CostSavings
 from ...interfaces.repositories import RecommendationRepository
-from google.api_core import exceptions
+from .lazy_client import LazyClient
+from .proto import raw_pages, to_datetime
+from .resilience import call_api
 
 logger = logging.getLogger(__name__)
 
+def _build_recommender_client():
+    from google.cloud import recommender_v1
+    return recommender_v1.RecommenderClient()
+
+def map_recommendations(recommendations) -> List[Recommendation]:
+    """
+    Maps a page of raw Recommendation protobufs to domain models in one pass.
+    """
+    from google.cloud import recommender_v1
+    from google.protobuf import json_format
+
+    cost_category = recommender_v1.Impact.Category.COST
+    priority_names = {p.value: p.name for p in recommender_v1.Recommendation.Priority}
+
+    recs = []
+    for r in recommendations:
+        ops = []
+        for operation_group in r.content.operation_groups:
+            for op in operation_group.operations:
+                ops.append(Operation(
+                    action=op.action,
+                    resource=op.resource,
+                    resource_type=op.resource_type,
+                    path=op.path,
+                    value_summary=str(json_format.MessageToDict(op.value)) if op.HasField("value") else None
+                ))
+
+        savings = None
+        impact = r.primary_impact
+        if impact.category == cost_category:
+            cost = impact.cost_projection.cost
+            # Convert units and nanos to float
+            amount = -1 * (cost.units + cost.nanos / 1e9)
+            savings = CostSavings(
+                currency=cost.currency_code,
+                amount_per_month=amount
+            )
+
+        recs.append(Recommendation(
+            recommendation_id=r.name,
+            description=r.description,
+            last_refresh_time=to_datetime(r, "last_refresh_time"),
+            priority=priority_names.get(r.priority, "PRIORITY_UNSPECIFIED"), # Enum to string
+            recommender_subtype=r.recommender_subtype,
+            operations=ops,
+            cost_savings=savings
+        ))
+    return recs
+
 class GCPRecommendationRepository(RecommendationRepository):
-    def get_recommendations(self, project_id: str, zone: str) -> List[Recommendation]:
-        recommenders = [
-            "google.compute.instance.IdleResourceRecommender",
-            "google.compute.instance.RightsizingRecommender"
-        ]
-        
+    recommender_ids = [
+        "google.compute.instance.IdleResourceRecommender",
+        "google.compute.instance.RightsizingRecommender"
+    ]
+
+    def __init__(self):
+        # The SDK import and client construction are deferred until the first query
+        self._client = LazyClient("RecommenderClient", _build_recommender_client)
+
+    def backend_status(self) -> Dict[str, dict]:
+        return {"recommender": self._client.status()}
+
+    def get_recommendations(
+        self, project_id: str, zone: str, recommender_ids: Optional[List[str]] = None
+    ) -> List[Recommendation]:
         all_recs = []
-        # In a real app, we should probably inject the client or creating it per request might be okay relative to network latency
-        client = recommender_v1.RecommenderClient()
+        client = self._client.require()
 
-        for rec_id in recommenders:
+        for rec_id in recommender_ids or self.recommender_ids:
             parent = f"projects/{project_id}/locations/{zone}/recommenders/{rec_id}"
+
+            # List recommendations; idempotent, so slow calls are hedged
+            def list_recommendations(timeout: float, parent: str = parent) -> List[Recommendation]:
+                recs = []
+                for page in raw_pages(client.list_recommendations(parent=parent, timeout=timeout)):
+                    recs.extend(map_recommendations(page.recommendations))
+                return recs
+
             try:
-                # List recommendations
-                response = client.list_recommendations(parent=parent)
-                
-                for r in response:
-                    # Map to Domain Model
-                    ops = []
-                    for operation_group in r.content.operation_groups:
-                        for op in operation_group.operations:
-                            ops.append(Operation(
-                                action=op.action,
-                                resource=op.resource,
-                                resource_type=op.resource_type,
-                                path=op.path,
-                                value_summary=str(op.value) if op.value else None
-                            ))
-                    
-                    savings = None
-                    if r.primary_impact.category == recommender_v1.Impact.Category.COST:
-                        cost = r.primary_impact.cost_projection.cost
-                        # Convert units and nanos to float
-                        amount = -1 * (cost.units + cost.nanos / 1e9)
-                        savings = CostSavings(
-                            currency=cost.currency_code,
-                            amount_per_month=amount
-                        )
-
-                    all_recs.append(Recommendation(
-                        recommendation_id=r.name,
-                        description=r.description,
-                        last_refresh_time=r.last_refresh_time,
-                        priority=r.priority.name, # Enum to string
-                        recommender_subtype=r.recommender_subtype,
-                        operations=ops,
-                        cost_savings=savings
-                    ))
-                    
-            except exceptions.GoogleAPICallError as e:
+                all_recs.extend(call_api("recommender", list_recommendations))
+            except Exception as e:
                 logger.error(f"Error fetching {rec_id}: {e}")
-                
+                raise
+
         return all_recs
@@ -0,0 +1,193 @@
+import os
+import threading
+import time
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class ApiDeadlineExceeded(TimeoutError):
+    """The call (including any hedged attempt) did not finish within the API's deadline."""
+
+class CircuitOpenError(RuntimeError):
+    """The API's circuit breaker is open, so the call was not attempted."""
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive transient failures and rejects calls
+    for `reset_timeout` seconds. After that one trial call is let through (half-open):
+    success closes the breaker, failure opens it again.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._state = self.CLOSED
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+    def record_skipped(self) -> None:
+        """The call never reached the backend; a half-open breaker lets the next call be the trial."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.OPEN
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+@dataclass
+class ApiPolicy:
+    """
+    Per-API call policy. `timeout` bounds the whole call in seconds; `hedge_after` is how
+    long to wait before starting a second attempt of an idempotent call (None disables hedging).
+    Each API runs its attempts on its own `max_workers` threads (a bulkhead), so a slow
+    backend can only exhaust its own threads and never delays calls to the other APIs.
+    """
+    timeout: float
+    hedge_after: Optional[float] = None
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    max_workers: int = 8
+    executor: ThreadPoolExecutor = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Attempts run here so a hung RPC can be abandoned at its deadline; the RPC itself
+        # is also given the timeout, so abandoned threads finish on their own.
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="gcp-call")
+
+# name -> (timeout seconds, hedge after seconds, concurrent attempts)
+_DEFAULTS = {
+    "recommender": (10.0, 2.0, 16),
+    "monitoring": (20.0, 5.0, 4),
+    "compute": (15.0, 3.0, 8),
+    "asset": (20.0, 5.0, 4),
+    "resource_manager": (10.0, 2.0, 4),
+}
+
+def _env_float(name: str, default: Optional[float]) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+def _build_policies() -> Dict[str, ApiPolicy]:
+    """
+    Policies can be tuned per API with FINOPS_<API>_TIMEOUT, FINOPS_<API>_HEDGE_AFTER
+    (0 disables hedging) and FINOPS_<API>_CONCURRENCY, e.g. FINOPS_RECOMMENDER_TIMEOUT=5.
+    """
+    policies = {}
+    for api, (timeout, hedge_after, max_workers) in _DEFAULTS.items():
+        prefix = f"FINOPS_{api.upper()}_"
+        hedge_after = _env_float(prefix + "HEDGE_AFTER", hedge_after)
+        policies[api] = ApiPolicy(
+            timeout=_env_float(prefix + "TIMEOUT", timeout),
+            hedge_after=hedge_after or None,
+            breaker=CircuitBreaker(
+                failure_threshold=int(os.getenv("FINOPS_BREAKER_FAILURES", "5")),
+                reset_timeout=_env_float("FINOPS_BREAKER_RESET_SECONDS", 30.0)
+            ),
+            max_workers=int(os.getenv(prefix + "CONCURRENCY", str(max_workers)))
+        )
+    return policies
+
+API_POLICIES = _build_policies()
+
+def circuit_status() -> Dict[str, str]:
+    return {api: policy.breaker.state for api, policy in API_POLICIES.items()}
+
+def describe_failure(error: Exception) -> str:
+    """Short reason for a failed call, as reported in incomplete results."""
+    if isinstance(error, ApiDeadlineExceeded):
+        return "deadline exceeded"
+    if isinstance(error, CircuitOpenError):
+        return "circuit open"
+    return str(error) or type(error).__name__
+
+def is_transient(error: Exception) -> bool:
+    """
+    Errors worth retrying and counting against the breaker: timeouts, throttling and
+    server-side failures. Client errors such as PermissionDenied are not.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    from google.api_core import exceptions
+    return isinstance(error, (exceptions.ServerError, exceptions.TooManyRequests, exceptions.DeadlineExceeded))
+
+def call_api(api: str, fn: Callable[[float], T], idempotent: bool = True) -> T:
+    """
+    Runs fn(timeout) under the API's policy: the circuit breaker is checked first, the
+    whole call is bounded by the deadline, and idempotent calls are hedged with a second
+    attempt if the first is slow or fails transiently. The first successful attempt wins.
+    """
+    policy = API_POLICIES[api]
+    if not policy.breaker.allow():
+        raise CircuitOpenError(f"{api} circuit is open")
+
+    deadline = time.monotonic() + policy.timeout
+    hedge_at = time.monotonic() + policy.hedge_after if idempotent and policy.hedge_after else None
+    pending = {policy.executor.submit(fn, policy.timeout)}
+    hedged = False
+    error: Optional[Exception] = None
+
+    while pending:
+        now = time.monotonic()
+        if now >= deadline:
+            break
+        wake = min(deadline, hedge_at) if hedge_at and not hedged else deadline
+        done, pending = wait(pending, timeout=max(wake - now, 0.0), return_when=FIRST_COMPLETED)
+
+        for future in done:
+            if future.exception() is None:
+                policy.breaker.record_success()
+                return future.result()
+            error = future.exception()
+
+        can_hedge = hedge_at is not None and not hedged
+        slow = not done and time.monotonic() >= (hedge_at or deadline)
+        failed_transiently = done and not pending and error is not None and is_transient(error)
+        if can_hedge and (slow or failed_transiently):
+            logger.info(f"Hedging {api} call")
+            pending.add(policy.executor.submit(fn, max(deadline - time.monotonic(), 0.0)))
+            hedged = True
+
+    if error is None or pending:
+        # Attempts still queued are dropped. If none ever started, the time went waiting for
+        # this API's own threads rather than on the backend, so the breaker isn't charged
+        started = error is not None or not all([future.cancel() for future in pending])
+        error = ApiDeadlineExceeded(f"{api} call exceeded {policy.timeout:.0f}s deadline")
+        if not started:
+            policy.breaker.record_skipped()
+            raise error
+    if is_transient(error):
+        policy.breaker.record_failure()
+    else:
+        # The backend answered (e.g. PermissionDenied), so it is reachable
+        policy.breaker.record_success()
+    raise error
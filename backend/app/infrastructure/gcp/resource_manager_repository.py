@@ -1,38 +1,58 @@
-from google.cloud import resourcemanager_v3
 from typing import List, Dict
+from .lazy_client import LazyClient
+from .proto import raw_pages, to_datetime
+from .resilience import call_api
+
+def _build_projects_client():
+    from google.cloud import resourcemanager_v3
+    return resourcemanager_v3.ProjectsClient()
+
+def map_project(project) -> Dict[str, str]:
+    """
+    Maps a raw Project protobuf to the project record.
+    """
+    create_time = to_datetime(project, "create_time")
+    return {
+        "project_id": project.project_id,
+        "display_name": project.display_name,
+        "create_time": create_time.strftime("%Y-%m-%d") if create_time else "N/A",
+        "parent": project.parent
+    }
 
 class GCPProjectRepository:
     def __init__(self):
-        try:
-            self.client = resourcemanager_v3.ProjectsClient()
-        except Exception as e:
-            print(f"Warning: Could not initialize ProjectsClient. Service account might be missing permissions. Error: {e}")
-            self.client = None
+        # The SDK import and client construction are deferred until the first query
+        self._client = LazyClient("ProjectsClient", _build_projects_client)
+
+    @property
+    def client(self):
+        return self._client.get()
+
+    def backend_status(self) -> Dict[str, dict]:
+        return {"resource_manager": self._client.status()}
 
     def list_accessible_projects(self) -> List[Dict[str, str]]:
         """
         Lists projects accessible to the service account.
         Returns a list of dicts with 'project_id' and 'display_name'.
         """
-        if not self.client:
-            return []
+        client = self._client.require()
+
+        from google.cloud import resourcemanager_v3
 
         try:
             # List projects
             request = resourcemanager_v3.ListProjectsRequest()
-            page_result = self.client.list_projects(request=request)
-
-            projects = []
-            for project in page_result:
-                if project.state == resourcemanager_v3.Project.State.ACTIVE:
-                    projects.append({
-                        "project_id": project.project_id,
-                        "display_name": project.display_name,
-                        "create_time": project.create_time.strftime("%Y-%m-%d"),
-                        "parent": project.parent
-                    })
-            return projects
+            active = resourcemanager_v3.Project.State.ACTIVE
+
+            def list_projects(timeout: float) -> List[Dict[str, str]]:
+                projects = []
+                for page in raw_pages(client.list_projects(request=request, timeout=timeout)):
+                    projects.extend(map_project(project) for project in page.projects if project.state == active)
+                return projects
+
+            return call_api("resource_manager", list_projects)
         except Exception as e:
+            # Surface the failure instead of an empty list that looks like "no projects"
             print(f"Error listing projects: {e}")
-            # Fallback to single project from env if listing fails/forbidden
-            return []
+            raise
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from typing import Any, Optional
+
+class ResultCache(ABC):
+    """
+    Cache shared by every worker process. Values must be built from JSON types, domain
+    dataclasses and datetimes, so that every backend can store them.
+    """
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """Stores a value that expires after ttl_seconds."""
+        pass
+
+    @abstractmethod
+    def lock(self, name: str) -> AbstractContextManager:
+        """
+        Cross-process lock. The context manager yields True if the lock was acquired,
+        or False if waiting timed out and the caller is proceeding without it.
+        """
+        pass
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+from ..domain.models import ZombieResource
+
+class Inventory:
+    """
+    Resource datasets fetched once per project scan and shared by every detector.
+    Datasets are plain records (dicts), keyed by dataset name, e.g. 'instances' or 'disks'.
+    """
+    def __init__(self, project_id: str, zones: List[str], datasets: Dict[str, Any]):
+        self.project_id = project_id
+        self.zones = zones
+        # us-central1-a -> us-central1
+        self.regions = sorted({"-".join(zone.split("-")[:-1]) for zone in zones})
+        self.datasets = datasets
+
+    def get(self, name: str) -> Any:
+        return self.datasets[name]
+
+class ZombieDetector(ABC):
+    """
+    A zombie detector plugin. Detectors never call GCP themselves; they declare the
+    datasets they need in `requires` and inspect them in memory.
+    """
+    name: str = ""
+    requires: Tuple[str, ...] = ()
+
+    @abstractmethod
+    def detect(self, inventory: Inventory) -> List[ZombieResource]:
+        """Returns the zombies found in the inventory, limited to the inventory's zones/regions."""
+        pass
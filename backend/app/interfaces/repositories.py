@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import List
-from ..domain.models import Recommendation, ZombieResource
+from typing import Dict, List, Optional, Tuple
+from ..domain.models import Recommendation, ScanIssue, ZombieResource
 
 class RecommendationRepository(ABC):
     @abstractmethod
-    def get_recommendations(self, project_id: str, zone: str) -> List[Recommendation]:
-        """Fetches recommendations for a given project and zone."""
+    def get_recommendations(
+        self, project_id: str, zone: str, recommender_ids: Optional[List[str]] = None
+    ) -> List[Recommendation]:
+        """Fetches recommendations for a given project and zone. Raises if a recommender call fails."""
         pass
 
 class ZombieRepository(ABC):
@@ -13,3 +15,22 @@ class ZombieRepository(ABC):
     def detect_zombies(self, project_id: str, location: str) -> List[ZombieResource]:
         """Detects idle or unused resources."""
         pass
+
+    @abstractmethod
+    def detect_zombies_in_zones(
+        self, project_id: str, zones: List[str], refresh: bool = False
+    ) -> Tuple[Dict[str, List[ZombieResource]], List[ScanIssue]]:
+        """
+        Detects idle or unused resources across several zones in one pass, grouped by zone,
+        along with the datasets or detectors that could not contribute.
+        With refresh, cached inventory datasets are refetched.
+        """
+        pass
+
+    @abstractmethod
+    def list_zombie_zones(self, project_id: str, refresh: bool = False) -> List[str]:
+        """
+        Zones that may hold zombies without holding any live compute resource, e.g. the zone
+        of a deleted disk that still has snapshots. Zone discovery adds these zones.
+        """
+        pass
@@ -1,5 +1,7 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from typing import Optional, List
 import os
 
@@ -8,6 +10,10 @@ from app.infrastructure.gcp.monitoring_repository import GCPZombieRepository
 from app.infrastructure.gcp.resource_manager_repository import GCPProjectRepository
 from app.infrastructure.gcp.asset_repository import GCPAssetRepository
 from app.application.services import FinOpsService
+from app.infrastructure.cache.file_cache import FileResultCache
+from app.infrastructure.cache.redis_cache import RedisResultCache
+from app.infrastructure.gcp.resilience import ApiDeadlineExceeded, CircuitOpenError, circuit_status
+from app.infrastructure.gcp.lazy_client import ClientUnavailableError, retry_failed_clients
 
 app = FastAPI(title="GCP FinOps Intelligence Hub API")
 
@@ -18,11 +24,30 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # Lets the dashboard read versions for conditional requests
 )
 
+def build_result_cache():
+    """
+    Shared result cache so every uvicorn worker (WEB_CONCURRENCY) sees one copy of
+    reports, inventories and instance indexes.
+    FINOPS_CACHE_BACKEND: 'file' (default, shared by workers in one container),
+    'redis' (shared across containers, FINOPS_REDIS_URL) or 'none'.
+    """
+    backend = os.getenv("FINOPS_CACHE_BACKEND", "file").lower()
+    if backend == "redis":
+        return RedisResultCache(url=os.getenv("FINOPS_REDIS_URL", "redis://localhost:6379/0"))
+    if backend == "file":
+        return FileResultCache(os.getenv("FINOPS_CACHE_DIR", "/tmp/finops-cache"))
+    return None
+
+cache = build_result_cache()
+cache_ttl_seconds = int(os.getenv("FINOPS_CACHE_TTL_SECONDS", "300"))
+
 # Dependency Injection using simple singletons for this scale
+# Repositories import their SDK and build their clients on first use, keeping startup fast
 recommender_repo = GCPRecommendationRepository()
-zombie_repo = GCPZombieRepository()
+zombie_repo = GCPZombieRepository(cache, cache_ttl_seconds)
 project_repo = GCPProjectRepository()
 asset_repo = GCPAssetRepository()
 
@@ -30,9 +55,27 @@ finops_service = FinOpsService(
     recommender_repo, 
     zombie_repo, 
     project_repo, 
-    asset_repo
+    asset_repo,
+    cache=cache,
+    cache_ttl_seconds=cache_ttl_seconds,
+    # Per-API deadlines are configured in app/infrastructure/gcp/resilience.py
+    report_deadline_seconds=float(os.getenv("FINOPS_REPORT_DEADLINE_SECONDS", "30")),
+    zone_discovery_ttl_seconds=int(os.getenv("FINOPS_ZONE_DISCOVERY_TTL_SECONDS", "3600"))
 )
 
+def conditional_response(version: str, payload, if_none_match: Optional[str]) -> Response:
+    """
+    Answers with 304 Not Modified when the client already holds this version,
+    otherwise with the payload tagged by its ETag.
+    """
+    etag = f'"{version}"'
+    if if_none_match:
+        tags = [t.strip() for t in if_none_match.split(",")]
+        if "*" in tags or etag in tags or f"W/{etag}" in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    # no-cache: caches may keep the body but must revalidate with If-None-Match
+    return JSONResponse(jsonable_encoder(payload), headers={"ETag": etag, "Cache-Control": "no-cache"})
+
 @app.get("/")
 def read_root():
     return {"status": "ok", "service": "GCP FinOps Intelligence Hub"}
@@ -44,34 +87,66 @@ def get_projects():
     """
     try:
         return finops_service.get_accessible_projects()
+    except (ApiDeadlineExceeded, CircuitOpenError, ClientUnavailableError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/resources")
-def get_resources(project_id: str, zones: Optional[str] = None):
+def get_resources(
+    project_id: str,
+    zones: Optional[str] = None,
+    refresh: bool = False,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     List all resources in the project, optionally filtered by zone.
+    Pass refresh=true to bypass the shared cache. Supports If-None-Match.
     """
     try:
         zone_list = [z.strip() for z in zones.split(",") if z.strip()] if zones else None
-        return finops_service.get_all_resources(project_id, zone_list)
+        version, resources = finops_service.get_versioned_resources(project_id, zone_list, refresh)
+        return conditional_response(version, resources, if_none_match)
+    except (ApiDeadlineExceeded, CircuitOpenError, ClientUnavailableError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/v1/report")
-def get_report(project_id: str, zones: str):
+def get_report(
+    project_id: str,
+    zones: str,
+    refresh: bool = False,
+    since: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Optimization report. Supports If-None-Match (304 when unchanged), and
+    since=<version> to return only recommendations and zombies changed since that version.
+    zones=auto scans only the zones that hold compute resources or snapshots of deleted disks.
+    """
     try:
         if not project_id:
             raise HTTPException(status_code=400, detail="project_id is required")
         
-        # Parse zones string "us-central1-a,us-central1-b" -> list
-        zone_list = [z.strip() for z in zones.split(",") if z.strip()]
-        
-        if not zone_list:
-             raise HTTPException(status_code=400, detail="At least one zone is required")
+        if zones.strip().lower() == "auto":
+            # May be empty for a project without compute resources, giving an empty report
+            zone_list = finops_service.discover_zones(project_id, refresh)
+        else:
+            # Parse zones string "us-central1-a,us-central1-b" -> list
+            zone_list = [z.strip() for z in zones.split(",") if z.strip()]
+
+            if not zone_list:
+                 raise HTTPException(status_code=400, detail="At least one zone is required")
+
+        if since:
+            _, delta = finops_service.get_report_delta(project_id, zone_list, since, refresh)
+            return delta
 
-        report = finops_service.get_optimization_report(project_id, zone_list)
-        return report
+        version, report = finops_service.get_versioned_report(project_id, zone_list, refresh)
+        return conditional_response(version, report, if_none_match)
+    except (ApiDeadlineExceeded, CircuitOpenError, ClientUnavailableError) as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         # Log the error in a real app
         raise HTTPException(status_code=500, detail=str(e))
@@ -80,6 +155,33 @@ def get_report(project_id: str, zones: str):
 def health_check():
     return {"status": "healthy"}
 
+@app.get("/health/live")
+def liveness_check():
+    """
+    Liveness probe. Never touches GCP, so it answers as soon as the process is up.
+    """
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+def readiness_check():
+    """
+    Readiness probe. Reports which GCP backends have been initialized so far.
+    Backends are created on first use. A failed initialization makes the probe fail (503);
+    failed backends are retried here once their backoff has passed, so the pod can recover.
+    An open circuit breaker only reports "degraded".
+    """
+    retry_failed_clients()
+    backends = finops_service.get_backend_status()
+    circuits = circuit_status()
+    failed = [name for name, status in backends.items() if status["state"] == "failed"]
+    open_circuits = [api for api, state in circuits.items() if state != "closed"]
+    body = {
+        "status": "unavailable" if failed else "degraded" if open_circuits else "ready",
+        "backends": backends,
+        "circuits": circuits
+    }
+    return JSONResponse(body, status_code=503 if failed else 200)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,137 @@
+import os
+import sys
+import timeit
+
+# Per-record conversion cost of each repository's result mapping: field-by-field
+# access through proto-plus wrappers (before) vs the raw-protobuf mappers (after).
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from google.cloud import asset_v1, compute_v1, monitoring_v3, recommender_v1, resourcemanager_v3
+
+from app.domain.models import CostSavings, Operation, Recommendation
+from app.infrastructure.gcp.asset_repository import map_resource
+from app.infrastructure.gcp.inventory import map_cpu_series, map_disk, map_instance
+from app.infrastructure.gcp.proto import raw
+from app.infrastructure.gcp.recommender_repository import map_recommendations
+from app.infrastructure.gcp.resource_manager_repository import map_project
+
+RECORDS = 500
+REPEAT = 5
+
+def _sample_recommendation(i):
+    return recommender_v1.Recommendation(
+        name=f"projects/p/locations/us-central1-a/recommenders/r/recommendations/{i}",
+        description="Save cost by stopping idle VM",
+        priority=recommender_v1.Recommendation.Priority.P2,
+        recommender_subtype="STOP_VM",
+        last_refresh_time={"seconds": 1700000000},
+        content={"operation_groups": [{"operations": [
+            {"action": "test", "resource": f"//compute.googleapis.com/vm-{i}", "resource_type": "compute.googleapis.com/Instance", "path": "/status", "value": "RUNNING"},
+            {"action": "replace", "resource": f"//compute.googleapis.com/vm-{i}", "resource_type": "compute.googleapis.com/Instance", "path": "/status", "value": "TERMINATED"},
+        ]}]},
+        primary_impact={
+            "category": recommender_v1.Impact.Category.COST,
+            "cost_projection": {"cost": {"currency_code": "USD", "units": -24, "nanos": -460000000}},
+        },
+    )
+
+def _sample_series(i):
+    return monitoring_v3.TimeSeries(
+        resource={"labels": {"instance_id": str(i), "zone": "us-central1-a"}},
+        points=[{"value": {"double_value": 0.01 * d}} for d in range(30)],
+    )
+
+def _sample_instance(i):
+    return compute_v1.Instance(
+        id=i, name=f"vm-{i}", zone="https://www.googleapis.com/compute/v1/projects/p/zones/us-central1-a",
+        machine_type="zones/us-central1-a/machineTypes/e2-medium", status="RUNNING",
+        disks=[compute_v1.AttachedDisk(source=f"https://www.googleapis.com/compute/v1/projects/p/zones/us-central1-a/disks/vm-{i}")],
+    )
+
+def _sample_disk(i):
+    return compute_v1.Disk(
+        id=i, name=f"disk-{i}", zone="https://www.googleapis.com/compute/v1/projects/p/zones/us-central1-a",
+        size_gb=100, users=[f"vm-{i}"], self_link=f"https://www.googleapis.com/compute/v1/projects/p/zones/us-central1-a/disks/disk-{i}",
+    )
+
+def _sample_resource(i):
+    return asset_v1.ResourceSearchResult(
+        display_name=f"vm-{i}", asset_type="compute.googleapis.com/Instance", location="us-central1-a",
+        project="projects/123456", state="RUNNING", create_time={"seconds": 1700000000},
+    )
+
+def _sample_project(i):
+    return resourcemanager_v3.Project(
+        project_id=f"project-{i}", display_name=f"Project {i}", parent="organizations/1",
+        state=resourcemanager_v3.Project.State.ACTIVE, create_time={"seconds": 1700000000},
+    )
+
+# --- Previous proto-plus mappings, kept here as the baseline ---
+
+def before_recommendations(recs):
+    out = []
+    for r in recs:
+        ops = []
+        for operation_group in r.content.operation_groups:
+            for op in operation_group.operations:
+                ops.append(Operation(action=op.action, resource=op.resource, resource_type=op.resource_type,
+                                     path=op.path, value_summary=str(op.value) if op.value else None))
+        savings = None
+        if r.primary_impact.category == recommender_v1.Impact.Category.COST:
+            cost = r.primary_impact.cost_projection.cost
+            savings = CostSavings(currency=cost.currency_code, amount_per_month=-1 * (cost.units + cost.nanos / 1e9))
+        out.append(Recommendation(recommendation_id=r.name, description=r.description, last_refresh_time=r.last_refresh_time,
+                                  priority=r.priority.name, recommender_subtype=r.recommender_subtype,
+                                  operations=ops, cost_savings=savings))
+    return out
+
+def before_series(series_list):
+    out = {}
+    for series in series_list:
+        out[series.resource.labels.get("instance_id")] = max((p.value.double_value for p in series.points), default=0.0)
+    return out
+
+def before_instances(instances):
+    return [{"id": str(inst.id), "name": inst.name, "zone": inst.zone.split("/")[-1],
+             "machine_type": inst.machine_type.split("/")[-1], "status": inst.status,
+             "disks": [d.source for d in inst.disks]} for inst in instances]
+
+def before_disks(disks):
+    return [{"id": str(d.id), "name": d.name, "zone": d.zone.split("/")[-1], "size_gb": d.size_gb,
+             "users": list(d.users), "self_link": d.self_link} for d in disks]
+
+def before_resources(resources):
+    return [{"name": r.display_name, "asset_type": r.asset_type, "location": r.location,
+             "project": r.project.split('/')[-1], "state": r.state,
+             "create_time": r.create_time.strftime("%Y-%m-%d %H:%M:%S") if r.create_time else "N/A"} for r in resources]
+
+def before_projects(projects):
+    return [{"project_id": p.project_id, "display_name": p.display_name,
+             "create_time": p.create_time.strftime("%Y-%m-%d"), "parent": p.parent}
+            for p in projects if p.state == resourcemanager_v3.Project.State.ACTIVE]
+
+def after_projects(projects):
+    active = resourcemanager_v3.Project.State.ACTIVE
+    return [map_project(p) for p in projects if p.state == active]
+
+CASES = [
+    ("recommender", _sample_recommendation, before_recommendations, map_recommendations),
+    ("monitoring (cpu series)", _sample_series, before_series, lambda s: dict(map(map_cpu_series, s))),
+    ("compute (instances)", _sample_instance, before_instances, lambda s: list(map(map_instance, s))),
+    ("compute (disks)", _sample_disk, before_disks, lambda s: list(map(map_disk, s))),
+    ("asset", _sample_resource, before_resources, lambda s: [map_resource(r) for r in s]),
+    ("resource manager", _sample_project, before_projects, after_projects),
+]
+
+def per_record_us(fn, records) -> float:
+    best = min(timeit.repeat(lambda: fn(records), number=1, repeat=REPEAT))
+    return best / len(records) * 1e6
+
+if __name__ == "__main__":
+    print(f"--- Per-record mapping cost ({RECORDS} records, best of {REPEAT}) ---")
+    for label, sample, before, after in CASES:
+        wrapped = [sample(i) for i in range(RECORDS)]
+        raw_records = [raw(m) for m in wrapped]
+        before_us = per_record_us(before, wrapped)
+        after_us = per_record_us(after, raw_records)
+        print(f"{label:>24}: before {before_us:8.2f} us | after {after_us:8.2f} us | {before_us / after_us:5.1f}x")
@@ -0,0 +1,66 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+# Measures cold-start cost of the backend: time to import `main` and time until
+# the first successful /health response. The "eager" run imports the five
+# google-cloud SDKs up front, which is what main.py paid before clients were lazy.
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+EAGER_IMPORTS = (
+    "from google.cloud import asset_v1, compute_v1, monitoring_v3, "
+    "recommender_v1, resourcemanager_v3; "
+)
+
+RUNS = 5
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def time_import(prelude: str) -> float:
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"{prelude}import main; "
+        "print(time.perf_counter() - t)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+def time_first_health(prelude: str, timeout: float = 60.0) -> float:
+    port = _free_port()
+    code = (
+        f"{prelude}import uvicorn, main; "
+        f"uvicorn.run(main.app, host='127.0.0.1', port={port}, log_level='warning')"
+    )
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", code], cwd=BACKEND_DIR)
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as res:
+                    if res.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError("backend did not answer /health in time")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+if __name__ == "__main__":
+    print(f"--- Startup benchmark (median of {RUNS} runs) ---")
+    for label, prelude in (("eager SDK imports", EAGER_IMPORTS), ("lazy (current)", "")):
+        import_s = median([time_import(prelude) for _ in range(RUNS)])
+        health_s = median([time_first_health(prelude) for _ in range(RUNS)])
+        print(f"{label:>18}: import main {import_s * 1000:8.1f} ms | first /health {health_s * 1000:8.1f} ms")
@@ -0,0 +1,156 @@
+import os
+import sys
+
+# Behavioural checks for the zombie detectors and GCPZombieRepository, run over hand-built
+# inventory datasets instead of GCP. Run from anywhere: python backend/tests/check_detectors.py
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.infrastructure.gcp.detectors import DISK_PRICE_PER_GB, PRICING, SNAPSHOT_PRICE_PER_GB, STATIC_IP_PRICE
+from app.infrastructure.gcp.monitoring_repository import GCPZombieRepository
+from app.interfaces.detectors import ZombieDetector
+
+PROJECT = "p"
+ZONES = ["europe-west1-b", "us-central1-a", "us-central1-b"]
+
+def link(zone: str, name: str) -> str:
+    return f"https://www.googleapis.com/compute/v1/projects/{PROJECT}/zones/{zone}/disks/{name}"
+
+def instance(id, zone, status, machine_type="e2-medium", disks=()):
+    return {"id": id, "name": f"vm-{id}", "zone": zone, "machine_type": machine_type, "status": status, "disks": list(disks)}
+
+def disk(id, zone, size_gb, users=()):
+    return {"id": id, "name": f"disk-{id}", "zone": zone, "size_gb": size_gb, "users": list(users), "self_link": link(zone, f"disk-{id}")}
+
+DATASETS = {
+    "instances": [
+        instance("1", "us-central1-a", "RUNNING", disks=[link("us-central1-a", "disk-11")]),
+        instance("2", "us-central1-a", "RUNNING"),
+        instance("3", "us-central1-b", "TERMINATED", disks=[link("us-central1-b", "disk-13")]),
+        instance("4", "us-central1-b", "TERMINATED", disks=[link("us-central1-b", "deleted")]),
+        instance("5", "asia-east1-a", "RUNNING"),
+        instance("6", "us-central1-a", "STOPPING"),
+    ],
+    "cpu_utilization": {
+        "1": {"zone": "us-central1-a", "peak": 0.01},   # idle
+        "2": {"zone": "us-central1-a", "peak": 0.50},   # busy
+        "3": {"zone": "us-central1-b", "peak": 0.00},   # stopped, not idle
+        "5": {"zone": "asia-east1-a", "peak": 0.00},    # outside the scanned zones
+        "6": {"zone": "us-central1-a", "peak": 0.00},   # not RUNNING
+        "99": {"zone": "us-central1-a", "peak": 0.00},  # deleted, metric history only
+    },
+    "disks": [
+        disk("11", "us-central1-a", 10, users=["vm-1"]),
+        disk("13", "us-central1-b", 50, users=["vm-3"]),
+        disk("14", "us-central1-b", 100),
+        disk("15", "asia-east1-a", 100),
+    ],
+    "addresses": [
+        {"id": "21", "name": "free", "region": "us-central1", "status": "RESERVED", "users": []},
+        {"id": "22", "name": "used", "region": "us-central1", "status": "IN_USE", "users": ["vm-1"]},
+        {"id": "23", "name": "far", "region": "asia-east1", "status": "RESERVED", "users": []},
+        {"id": "24", "name": "eu", "region": "europe-west1", "status": "RESERVED", "users": []},
+    ],
+    "snapshots": [
+        {"id": "31", "name": "orphan", "source_disk": f"projects/{PROJECT}/zones/us-central1-b/disks/gone", "source_disk_id": "98", "storage_bytes": 20_000_000_000},
+        {"id": "32", "name": "kept", "source_disk": f"projects/{PROJECT}/zones/us-central1-b/disks/disk-14", "source_disk_id": "14", "storage_bytes": 10_000_000_000},
+        {"id": "33", "name": "far", "source_disk": f"projects/{PROJECT}/zones/asia-east1-a/disks/gone", "source_disk_id": "97", "storage_bytes": 10_000_000_000},
+        {"id": "34", "name": "regional", "source_disk": f"projects/{PROJECT}/regions/us-central1/disks/gone", "source_disk_id": "96", "storage_bytes": 10_000_000_000},
+        {"id": "35", "name": "no-source", "source_disk": "", "source_disk_id": "", "storage_bytes": 10_000_000_000},
+    ],
+}
+
+def build_repo(failing=(), detectors=None) -> GCPZombieRepository:
+    repo = GCPZombieRepository(cache=None, detectors=detectors)
+
+    def fetcher(name):
+        def fetch(project_id):
+            if name in failing:
+                raise ConnectionError(f"{name} unavailable")
+            return DATASETS[name]
+        return fetch
+
+    repo.inventory._fetchers = {name: fetcher(name) for name in repo.inventory._fetchers}
+    return repo
+
+def check(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+    print(f"✅ {message}")
+
+def found(by_zone):
+    return {
+        (zombie.resource_type, zombie.resource_id): (zone, round(zombie.estimated_monthly_waste, 4))
+        for zone, zombies in by_zone.items() for zombie in zombies
+    }
+
+def check_full_scan():
+    by_zone, issues = build_repo().detect_zombies_in_zones(PROJECT, ZONES)
+    zombies = found(by_zone)
+    check(not issues, "a scan with every dataset reports no issues")
+    check(sorted(by_zone) == ZONES, "zombies are grouped under every scanned zone")
+
+    check(zombies.get(("gce_instance", "1")) == ("us-central1-a", PRICING["e2-medium"]), "an idle RUNNING VM is priced by machine type")
+    check(("gce_instance", "2") not in zombies, "a busy VM is not reported")
+    check(zombies.get(("gce_instance", "3")) == ("us-central1-b", 50 * DISK_PRICE_PER_GB), "a TERMINATED VM is reported once, priced by its billed disks")
+    check(("gce_instance", "4") not in zombies, "a TERMINATED VM without billed disks is not reported")
+    check(("gce_instance", "6") not in zombies, "an idle VM that isn't RUNNING is not reported as idle")
+    check(("gce_instance", "99") not in zombies, "metric history of a deleted VM is not reported")
+    check(("gce_instance", "5") not in zombies, "VMs outside the scanned zones are not reported")
+
+    check(zombies.get(("disk", "14")) == ("us-central1-b", 100 * DISK_PRICE_PER_GB), "an unattached disk is reported")
+    check(("disk", "11") not in zombies and ("disk", "15") not in zombies, "attached disks and disks outside the scanned zones are not reported")
+
+    check(zombies.get(("ip_address", "21")) == ("us-central1-a", STATIC_IP_PRICE), "a reserved, unused IP is attributed to the first scanned zone of its region")
+    check(zombies.get(("ip_address", "24")) == ("europe-west1-b", STATIC_IP_PRICE), "regional attribution works for each scanned region")
+    check(("ip_address", "22") not in zombies and ("ip_address", "23") not in zombies, "IPs in use or outside the scanned regions are not reported")
+
+    check(zombies.get(("snapshot", "31")) == ("us-central1-b", round(20 * SNAPSHOT_PRICE_PER_GB, 4)), "a snapshot whose source disk id is gone is orphaned, in the source disk's zone")
+    check(("snapshot", "32") not in zombies, "a snapshot whose source disk still exists is not orphaned")
+    check(
+        not {("snapshot", "33"), ("snapshot", "34"), ("snapshot", "35")} & set(zombies),
+        "snapshots of disks outside the scanned zones, regional disks or no disk are not reported"
+    )
+
+def check_missing_dataset():
+    by_zone, issues = build_repo(failing={"snapshots"}).detect_zombies_in_zones(PROJECT, ZONES)
+    sources = {issue.source for issue in issues}
+    check(sources == {"inventory:snapshots", "detector:orphaned_snapshots"}, "a failed dataset and the detector that needs it are reported as issues")
+    check(not any(zombie.resource_type == "snapshot" for zombies in by_zone.values() for zombie in zombies), "a detector missing a dataset is skipped")
+    check(("disk", "14") in found(by_zone), "detectors with their datasets still run")
+
+def check_zombie_zones():
+    zones = build_repo().list_zombie_zones(PROJECT)
+    check(zones == ["asia-east1-a", "us-central1-b"], "zone discovery adds the zones of snapshot source disks")
+
+class BrokenDetector(ZombieDetector):
+    name = "broken"
+    requires = ("disks",)
+
+    def detect(self, inventory):
+        raise ValueError("boom")
+
+def check_failing_detector():
+    _, issues = build_repo(detectors=[BrokenDetector()]).detect_zombies_in_zones(PROJECT, ZONES)
+    check([(issue.source, issue.reason) for issue in issues] == [("detector:broken", "boom")], "a failing detector is reported as an issue")
+
+def check_unknown_dataset():
+    class NeedsBilling(BrokenDetector):
+        requires = ("billing",)
+    rejected = False
+    try:
+        build_repo(detectors=[NeedsBilling()])
+    except ValueError:
+        rejected = True
+    check(rejected, "a detector requiring an unknown dataset is rejected")
+
+if __name__ == "__main__":
+    try:
+        check_full_scan()
+        check_missing_dataset()
+        check_zombie_zones()
+        check_failing_detector()
+        check_unknown_dataset()
+        print("\nAll detector checks passed!")
+    except Exception as e:
+        print(f"\n❌ Detector check failed: {e}")
+        sys.exit(1)
@@ -0,0 +1,147 @@
+import os
+import sys
+import threading
+import time
+
+# Behavioural checks for call_api hedging and the circuit breaker, using fake calls
+# instead of GCP. Run from anywhere: python backend/tests/check_resilience.py
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from google.api_core import exceptions
+from app.infrastructure.gcp.resilience import (
+    API_POLICIES, ApiDeadlineExceeded, ApiPolicy, CircuitBreaker, CircuitOpenError, call_api
+)
+
+class FakeCall:
+    """Counts attempts; each attempt runs the next behaviour in the list (the last one repeats)."""
+    def __init__(self, *behaviours):
+        self.behaviours = behaviours
+        self.attempts = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, timeout: float):
+        with self._lock:
+            behaviour = self.behaviours[min(self.attempts, len(self.behaviours) - 1)]
+            self.attempts += 1
+        return behaviour()
+
+def slow(seconds: float, value: str = "slow"):
+    def run():
+        time.sleep(seconds)
+        return value
+    return run
+
+def fail(error: Exception):
+    def run():
+        raise error
+    return run
+
+def use_policy(
+    hedge_after=None, failure_threshold: int = 5, reset_timeout: float = 30.0,
+    timeout: float = 2.0, max_workers: int = 8, api: str = "test"
+) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=reset_timeout)
+    API_POLICIES[api] = ApiPolicy(timeout=timeout, hedge_after=hedge_after, breaker=breaker, max_workers=max_workers)
+    return breaker
+
+def check(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+    print(f"✅ {message}")
+
+def check_slow_attempt_is_hedged():
+    use_policy(hedge_after=0.05)
+    call = FakeCall(slow(1.0), slow(0.0, "hedge"))
+    started = time.monotonic()
+    result = call_api("test", call)
+    check(result == "hedge" and call.attempts == 2, "a slow first attempt starts a hedge, which wins")
+    check(time.monotonic() - started < 0.5, "the hedged call returns without waiting for the slow attempt")
+
+def check_transient_failure_is_hedged():
+    use_policy(hedge_after=1.0)
+    call = FakeCall(fail(exceptions.ServiceUnavailable("flaky")), slow(0.0, "retry"))
+    started = time.monotonic()
+    result = call_api("test", call)
+    check(result == "retry" and call.attempts == 2, "a transient failure starts a hedge straight away")
+    check(time.monotonic() - started < 0.5, "the hedge after a failure doesn't wait for hedge_after")
+
+def check_non_transient_failure():
+    breaker = use_policy(hedge_after=0.05, failure_threshold=2)
+    call = FakeCall(fail(exceptions.PermissionDenied("denied")))
+    for _ in range(3):
+        try:
+            call_api("test", call)
+            raise AssertionError("PermissionDenied was swallowed")
+        except exceptions.PermissionDenied:
+            pass
+    check(call.attempts == 3, "a non-transient failure is not hedged")
+    check(breaker.state == CircuitBreaker.CLOSED, "non-transient failures don't open the breaker")
+
+def check_breaker_cycle():
+    breaker = use_policy(failure_threshold=2, reset_timeout=0.2)
+    failing = FakeCall(fail(exceptions.ServiceUnavailable("down")))
+    for _ in range(2):
+        try:
+            call_api("test", failing)
+        except exceptions.ServiceUnavailable:
+            pass
+    check(breaker.state == CircuitBreaker.OPEN, "the breaker opens after consecutive transient failures")
+
+    rejected = FakeCall(slow(0.0))
+    try:
+        call_api("test", rejected)
+        raise AssertionError("call went through an open breaker")
+    except CircuitOpenError:
+        pass
+    check(rejected.attempts == 0, "an open breaker rejects calls without attempting them")
+
+    time.sleep(0.25)
+    states = []
+    trial = FakeCall(lambda: states.append(breaker.state) or "ok")
+    check(call_api("test", trial) == "ok", "a trial call is let through after the reset timeout")
+    check(states == [CircuitBreaker.HALF_OPEN], "the trial call runs while the breaker is half-open")
+    check(breaker.state == CircuitBreaker.CLOSED, "a successful trial closes the breaker")
+
+def check_bulkhead():
+    breaker = use_policy(timeout=0.5, max_workers=2, failure_threshold=3)
+    use_policy(api="other")
+    def hang():
+        try:
+            call_api("test", FakeCall(slow(1.0)))
+        except ApiDeadlineExceeded:
+            pass
+
+    hung = [threading.Thread(target=hang) for _ in range(2)]
+    for thread in hung:
+        thread.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    check(call_api("other", FakeCall(slow(0.0, "ok"))) == "ok", "a saturated API doesn't hold up calls to other APIs")
+    check(time.monotonic() - started < 0.2, "the other API's call isn't queued behind the slow one")
+
+    queued = FakeCall(slow(0.0))
+    try:
+        call_api("test", queued)
+        raise AssertionError("a call queued past its deadline succeeded")
+    except ApiDeadlineExceeded:
+        pass
+    for thread in hung:
+        thread.join()
+    check(queued.attempts == 0, "an attempt still queued at the deadline is dropped")
+    check(breaker.state == CircuitBreaker.CLOSED, "time spent queued for a thread isn't charged to the breaker")
+
+if __name__ == "__main__":
+    try:
+        check_slow_attempt_is_hedged()
+        check_transient_failure_is_hedged()
+        check_non_transient_failure()
+        check_breaker_cycle()
+        check_bulkhead()
+        print("\nAll resilience checks passed!")
+    except Exception as e:
+        print(f"\n❌ Resilience check failed: {e}")
+        sys.exit(1)
+    finally:
+        API_POLICIES.pop("test", None)
+        API_POLICIES.pop("other", None)
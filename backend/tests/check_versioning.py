@@ -0,0 +1,148 @@
+import os
+import sys
+import tempfile
+
+# Behavioural checks for report versions: ETag / If-None-Match (304) handling and
+# since=<version> deltas, through the HTTP API with faked repositories.
+# Run from anywhere: python backend/tests/check_versioning.py
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("FINOPS_CACHE_BACKEND", "none")
+
+from fastapi.testclient import TestClient
+import main
+from app.application.services import FinOpsService
+from app.domain.models import CostSavings, Recommendation, ZombieResource
+from app.infrastructure.cache.file_cache import FileResultCache
+
+def recommendation(id: str, savings: float) -> Recommendation:
+    return Recommendation(
+        recommendation_id=id, description=f"Resize {id}", last_refresh_time=None, priority="P2",
+        recommender_subtype="CHANGE_MACHINE_TYPE", operations=[],
+        cost_savings=CostSavings(currency="USD", amount_per_month=-savings)
+    )
+
+def zombie(id: str, zone: str = None, region: str = None, waste: float = 1.0) -> ZombieResource:
+    return ZombieResource(
+        resource_id=id, resource_type="disk" if zone else "ip_address", name=id, project_id="p",
+        zone=zone, region=region, estimated_monthly_waste=waste
+    )
+
+# What the fake GCP project currently holds; checks edit it between scans
+STATE = {"recommendations": [], "zombies": []}
+
+class FakeRecommender:
+    recommender_ids = ["google.compute.instance.RightsizingRecommender"]
+
+    def get_recommendations(self, project_id, zone, recommender_ids=None):
+        return [rec for rec, rec_zone in STATE["recommendations"] if rec_zone == zone]
+
+class FakeZombies:
+    def detect_zombies_in_zones(self, project_id, zones, refresh=False):
+        by_zone = {zone: [] for zone in zones}
+        for z in STATE["zombies"]:
+            # Regional zombies go to the first scanned zone of their region, as in GCPZombieRepository
+            zone = z.zone or next(zone for zone in zones if zone.startswith(z.region))
+            by_zone[zone].append(z)
+        return by_zone, []
+
+class FakeAssets:
+    def list_all_resources(self, project_id, zones=None):
+        return [{"name": "vm-1", "asset_type": "compute.googleapis.com/Instance"}]
+
+def check(condition: bool, message: str) -> None:
+    if not condition:
+        raise AssertionError(message)
+    print(f"✅ {message}")
+
+def get_report(client, zones="us-central1-a,us-central1-b", refresh=False, since=None, if_none_match=None):
+    params = {"project_id": "p", "zones": zones, "refresh": refresh}
+    if since:
+        params["since"] = since
+    headers = {"If-None-Match": if_none_match} if if_none_match else {}
+    return client.get("/api/v1/report", params=params, headers=headers)
+
+def check_conditional_get(client):
+    response = get_report(client)
+    etag = response.headers["etag"]
+    check(response.status_code == 200 and etag.startswith('"'), "a report is returned with a quoted ETag")
+    check(response.headers["cache-control"] == "no-cache", "caches must revalidate the report")
+
+    for header, form in ((etag, "exact"), (f"W/{etag}", "weak"), ("*", "wildcard"), (f'"other", {etag}', "list")):
+        not_modified = get_report(client, if_none_match=header)
+        check(
+            not_modified.status_code == 304 and not not_modified.content and not_modified.headers["etag"] == etag,
+            f"If-None-Match ({form} form) answers 304 without a body"
+        )
+    check(get_report(client, if_none_match='"other"').status_code == 200, "a stale If-None-Match gets the full report")
+    return etag
+
+def check_stable_versions(client, etag):
+    rescan = get_report(client, refresh=True, if_none_match=etag)
+    check(rescan.status_code == 304, "an unchanged rescan keeps its version")
+    reordered = get_report(client, zones="us-central1-b,us-central1-a", refresh=True)
+    check(reordered.headers["etag"] == etag, "the zone order in the request doesn't change the version")
+    check(reordered.json()["zones_scanned"] == ["us-central1-a", "us-central1-b"], "zones are reported in a fixed order")
+
+def check_delta(client, etag):
+    since = etag.strip('"')
+    STATE["recommendations"] = [
+        (recommendation("rec-keep", 10.0), "us-central1-a"),
+        (recommendation("rec-change", 25.0), "us-central1-b"),
+        (recommendation("rec-new", 5.0), "us-central1-b"),
+    ]
+    STATE["zombies"] = [zombie("disk-new", zone="us-central1-a")]
+
+    changed = get_report(client, refresh=True, if_none_match=etag)
+    check(changed.status_code == 200 and changed.headers["etag"] != etag, "a rescan with new content gets a new version")
+
+    delta = get_report(client, since=since).json()
+    check(delta["delta"] and delta["since"] == since, "since=<known version> returns a delta")
+    added = sorted(r["recommendation_id"] for r in delta["recommendations"]["added"])
+    check(added == ["rec-change", "rec-keep", "rec-new"], "added recommendations are listed")
+    check([z["resource_id"] for z in delta["zombie_resources"]["added"]] == ["disk-new"], "added zombies are listed")
+
+    middle = changed.headers["etag"].strip('"')
+    STATE["recommendations"] = [
+        (recommendation("rec-keep", 10.0), "us-central1-a"),
+        (recommendation("rec-change", 30.0), "us-central1-b"),
+    ]
+    STATE["zombies"] = [zombie("ip-new", region="us-central1")]
+    get_report(client, refresh=True)
+
+    delta = get_report(client, since=middle).json()
+    check(delta["recommendations"]["removed"] == ["rec-new"], "removed recommendations are listed by id")
+    check([r["recommendation_id"] for r in delta["recommendations"]["changed"]] == ["rec-change"], "changed recommendations are listed")
+    check(delta["zombie_resources"]["removed"] == ["disk/disk-new"], "removed zombies are listed by type/id")
+    check([z["resource_id"] for z in delta["zombie_resources"]["added"]] == ["ip-new"], "zombies are diffed across scans")
+
+    current = get_report(client).headers["etag"].strip('"')
+    same = get_report(client, since=current).json()
+    check(
+        same["delta"] and not any(same["recommendations"].values()) and not any(same["zombie_resources"].values()),
+        "since=<current version> returns an empty delta"
+    )
+
+    unknown = get_report(client, since="0" * 32).json()
+    check(unknown["delta"] is False and unknown["report"]["project_id"] == "p", "an unknown version falls back to the full report")
+    other_zones = get_report(client, zones="us-central1-a", since=middle).json()
+    check(other_zones["delta"] is False, "a version from a different zone set falls back to the full report")
+
+def check_resources(client):
+    response = client.get("/api/v1/resources", params={"project_id": "p"})
+    repeat = client.get("/api/v1/resources", params={"project_id": "p"}, headers={"If-None-Match": response.headers["etag"]})
+    check(response.status_code == 200 and repeat.status_code == 304, "the resource inventory supports If-None-Match")
+
+if __name__ == "__main__":
+    main.finops_service = FinOpsService(
+        FakeRecommender(), FakeZombies(), object(), FakeAssets(), cache=FileResultCache(tempfile.mkdtemp())
+    )
+    client = TestClient(main.app)
+    try:
+        etag = check_conditional_get(client)
+        check_stable_versions(client, etag)
+        check_delta(client, etag)
+        check_resources(client)
+        print("\nAll versioning checks passed!")
+    except Exception as e:
+        print(f"\n❌ Versioning check failed: {e}")
+        sys.exit(1)
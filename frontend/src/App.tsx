@@ -1,5 +1,5 @@
 /* imports */
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { Card, Grid, Title, Text, Metric, Flex, Badge, Button, Table, TableHead, TableHeaderCell, TableBody, TableRow, TableCell, TextInput, DonutChart, BarList } from "@tremor/react";
 import { AreaChart } from "@tremor/react";
 import Sidebar from './components/Sidebar';
@@ -32,15 +32,25 @@ function App() {
     zones: localStorage.getItem('finops_zones') || 'us-central1-a, us-central1-b'
   });
   const [tempConfig, setTempConfig] = useState(config);
+  // ETag of the report currently shown, keyed by the query it answers
+  const reportEtag = useRef<{ query: string; etag: string } | null>(null);
 
   const fetchReport = () => {
     setLoadingReport(true);
     // In a real app, use the env var for base URL or proxy
     const apiUrl = import.meta.env.VITE_API_URL || 'http://localhost:8000';
     // Pass zones string directly, backend parses it
-    fetch(`${apiUrl}/api/v1/report?project_id=${config.projectId}&zones=${config.zones}`)
-      .then(res => res.json())
-      .then(data => setReport(data))
+    const query = `project_id=${config.projectId}&zones=${config.zones}`;
+    const cached = reportEtag.current?.query === query ? reportEtag.current.etag : null;
+    fetch(`${apiUrl}/api/v1/report?${query}`, { headers: cached ? { 'If-None-Match': cached } : {} })
+      .then(async res => {
+        // 304: the report on screen is still current, skip parsing and re-rendering
+        if (res.status === 304) return;
+        const data = await res.json();
+        const etag = res.headers.get('ETag');
+        reportEtag.current = etag ? { query, etag } : null;
+        setReport(data);
+      })
       .catch(err => console.error("Failed to fetch report", err))
       .finally(() => setLoadingReport(false));
   };
@@ -98,7 +108,7 @@ function App() {
             />
             <div className="w-48">
               <TextInput
-                placeholder="Zones (e.g. us-central1-a)"
+                placeholder="Zones (e.g. us-central1-a or auto)"
                 value={tempConfig.zones}
                 onChange={(e) => setTempConfig({ ...tempConfig, zones: e.target.value })}
                 onBlur={saveSettings} /* Auto-save on blur for better UX? Or keep manual button? Let's keep manual for now but maybe allow quick edit */
@@ -242,7 +252,7 @@ function App() {
                       <div className="mt-3">
                         <ConsoleLink
                           projectId={config.projectId}
-                          zone={res.zone || config.zones.split(',')[0].trim()}
+                          zone={res.zone || report.zones_scanned?.[0]}
                           resourceId={res.resource_id}
                           resourceType={res.resource_type}
                           name={res.name}
@@ -286,7 +296,7 @@ function App() {
                     value={tempConfig.zones}
                     onChange={(e) => setTempConfig({ ...tempConfig, zones: e.target.value })}
                   />
-                  <Text className="text-xs text-slate-500 mt-1">Comma-separated list of zones to monitor.</Text>
+                  <Text className="text-xs text-slate-500 mt-1">Comma-separated list of zones to monitor, or "auto" to scan only zones with compute resources.</Text>
                 </div>
                 <div className="pt-2">
                   <Button onClick={saveSettings}>Save & Refresh</Button>
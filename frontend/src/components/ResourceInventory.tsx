@@ -11,7 +11,7 @@ import {
     Badge,
     TextInput
 } from "@tremor/react";
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { MagnifyingGlassIcon } from "@heroicons/react/24/solid";
 
 interface Resource {
@@ -33,6 +33,8 @@ const ResourceInventory = ({ projectId, zones }: ResourceInventoryProps) => {
     const [filteredResources, setFilteredResources] = useState<Resource[]>([]);
     const [loading, setLoading] = useState(false);
     const [searchQuery, setSearchQuery] = useState("");
+    // ETag of the inventory currently shown, keyed by the query it answers
+    const inventoryEtag = useRef<{ query: string; etag: string } | null>(null);
 
     useEffect(() => {
         const fetchResources = async () => {
@@ -41,9 +43,16 @@ const ResourceInventory = ({ projectId, zones }: ResourceInventoryProps) => {
             setLoading(true);
             try {
                 const apiUrl = import.meta.env.VITE_API_URL || 'http://localhost:8000';
-                const res = await fetch(`${apiUrl}/api/v1/resources?project_id=${projectId}&zones=${zones}`);
+                const query = `project_id=${projectId}&zones=${zones}`;
+                const cached = inventoryEtag.current?.query === query ? inventoryEtag.current.etag : null;
+                const res = await fetch(`${apiUrl}/api/v1/resources?${query}`, {
+                    headers: cached ? { 'If-None-Match': cached } : {}
+                });
+                // A 304 is not "ok", so the inventory on screen is kept as is
                 if (res.ok) {
                     const data = await res.json();
+                    const etag = res.headers.get('ETag');
+                    inventoryEtag.current = etag ? { query, etag } : null;
                     setResources(data);
                     setFilteredResources(data);
                 }